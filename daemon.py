@@ -79,7 +79,7 @@ def main():
         logger.info(f"  - Simulation: {len(simulation.creatures)} creatures")
         logger.info(f"  - Network discovery on port 7890")
         logger.info(f"  - Network communication on port 7891")
-        logger.info(f"  - IPC server on port 7892")
+        logger.info(f"  - IPC server on {daemon_server.describe_endpoints()}")
         logger.info(
             f"  - Network manager: {'Connected' if simulation.network_manager else 'NOT Connected'}")
         logger.info("Press Ctrl+C to stop.")
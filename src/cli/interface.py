@@ -824,6 +824,10 @@ class ThrongletCLI:
             """
         )
 
+        parser.add_argument(
+            '--tcp', action='store_true',
+            help='Talk to the daemon over TCP even when its local socket is available')
+
         subparsers = parser.add_subparsers(
             dest='command', help='Available commands')
 
@@ -860,6 +864,10 @@ class ThrongletCLI:
 
         parsed_args = parser.parse_args(args)
 
+        if parsed_args.tcp:
+            from src.services.daemon_client import DaemonClient
+            self.daemon_client = DaemonClient(socket_path=None)
+
         # Execute commands
         if parsed_args.command == 'status':
             self.status()
@@ -7,6 +7,10 @@ Safe for home networks - uses local discovery only.
 DISCOVERY_PORT = 7890
 COMMUNICATION_PORT = 7891
 DAEMON_IPC_PORT = 7892
+DAEMON_SOCKET_PATH = "/run/thronglet/daemon.sock"  # local CLI <-> daemon IPC
+DAEMON_MAX_WORKERS = 32  # threads serving IPC requests
+DAEMON_REQUEST_TIMEOUT = 30  # seconds a client waits for a daemon reply
+DAEMON_MAX_REQUEST_SIZE = 64 * 1024  # bytes, larger IPC requests are refused
 
 # Discovery settings
 DISCOVERY_INTERVAL = 30  # seconds
@@ -29,5 +33,9 @@ ALLOWED_NETWORKS = [
 
 # Protocol settings
 MESSAGE_TIMEOUT = 10     # seconds
+PEER_QUERY_TIMEOUT = 2   # seconds, overall budget for peer status fan-out
+PEER_STATUS_MAX_AGE = 5  # seconds a peer's detailed status is reused
+PEER_CONN_IDLE_TIMEOUT = 30  # seconds a pooled peer connection may sit idle
+PEER_MAX_CONNECTIONS = 32  # inbound peer connections served at once
 MAX_MESSAGE_SIZE = 64000  # bytes
-PROTOCOL_VERSION = "1.0"
+PROTOCOL_VERSION = "1.2"
@@ -1,12 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Type, Optional
-import time
+from typing import Dict, List, Type, Optional
 import uuid
 import random
 from .creature import Creature, CreatureState, WorldState
 
 
 class BehaviorState(ABC):
+    def __init__(self, rng: random.Random):
+        # Source of every random draw, shared with the simulation engine
+        self.rng = rng
+
     @abstractmethod
     def enter(self, creature: Creature, world: WorldState) -> None:
         pass
@@ -29,14 +32,14 @@ class IdleState(BehaviorState):
         if creature.energy > 70 and creature.hunger < 30:
             # Well-fed and energetic = happy
             creature.happiness = min(
-                100, creature.happiness + random.randint(1, 3))
+                100, creature.happiness + self.rng.randint(1, 3))
         elif creature.energy < 30 or creature.hunger > 60:
             # Low energy or hungry = less happy
             creature.happiness = max(
-                0, creature.happiness - random.randint(1, 2))
+                0, creature.happiness - self.rng.randint(1, 2))
         else:
             # Neutral conditions = slight happiness drift
-            change = random.randint(-1, 1)
+            change = self.rng.randint(-1, 1)
             creature.happiness = max(0, min(100, creature.happiness + change))
 
     def update(self, creature: Creature, world: WorldState) -> Optional[CreatureState]:
@@ -53,7 +56,7 @@ class IdleState(BehaviorState):
             creature.energy > 50 and
             creature.happiness > 60 and
             world.can_support_creature() and
-                time.time() - creature.last_reproduced > 300):  # 5 minutes cooldown
+                world.last_update - creature.last_reproduced > 300):  # 5 minutes cooldown
             return CreatureState.REPRODUCING
 
         return None
@@ -65,7 +68,7 @@ class IdleState(BehaviorState):
 class HungryState(BehaviorState):
     def enter(self, creature: Creature, world: WorldState) -> None:
         # Being hungry makes creatures unhappy
-        creature.happiness = max(0, creature.happiness - random.randint(3, 7))
+        creature.happiness = max(0, creature.happiness - self.rng.randint(3, 7))
         # Higher energy consumption when hungry
         creature.energy = max(0, creature.energy - 2)
 
@@ -77,7 +80,7 @@ class HungryState(BehaviorState):
         # Continued hunger makes creatures more unhappy
         if creature.hunger > 80:
             creature.happiness = max(
-                0, creature.happiness - random.randint(1, 3))
+                0, creature.happiness - self.rng.randint(1, 3))
 
         # If food is available, start eating
         if world.has_food():
@@ -104,12 +107,12 @@ class EatingState(BehaviorState):
             creature.energy = min(100, creature.energy + 10)
             # Eating makes creatures VERY happy
             creature.happiness = min(
-                100, creature.happiness + random.randint(8, 15))
-            creature.last_fed = time.time()
+                100, creature.happiness + self.rng.randint(8, 15))
+            creature.last_fed = world.last_update
         else:
             # No food available, this shouldn't happen but handle gracefully
             creature.happiness = max(
-                0, creature.happiness - random.randint(5, 10))
+                0, creature.happiness - self.rng.randint(5, 10))
 
     def update(self, creature: Creature, world: WorldState) -> Optional[CreatureState]:
         # Check death conditions
@@ -129,8 +132,8 @@ class ReproducingState(BehaviorState):
         creature.energy = max(0, creature.energy - 20)
         # Reproduction makes creatures VERY happy (joy of parenthood)
         creature.happiness = min(
-            100, creature.happiness + random.randint(15, 25))
-        creature.last_reproduced = time.time()
+            100, creature.happiness + self.rng.randint(15, 25))
+        creature.last_reproduced = world.last_update
 
     def update(self, creature: Creature, world: WorldState) -> Optional[CreatureState]:
         # Check death conditions
@@ -150,7 +153,7 @@ class ReproducingState(BehaviorState):
     def _create_offspring(self, parent: Creature, world: WorldState) -> None:
         """Create a new creature as offspring"""
         # Generate offspring with inherited traits
-        offspring_name = f"{parent.name}-Jr-{int(time.time() % 1000)}"
+        offspring_name = f"{parent.name}-Jr-{int(world.last_update % 1000)}"
 
         # Basic inheritance - offspring gets some traits from parent
         inherited_max_age = parent.max_age + \
@@ -159,7 +162,7 @@ class ReproducingState(BehaviorState):
         inherited_energy = min(100, parent.energy + 10)
         # Inherit some happiness tendency
         inherited_happiness = max(
-            30, min(70, parent.happiness + random.randint(-10, 10)))
+            30, min(70, parent.happiness + self.rng.randint(-10, 10)))
 
         # Store offspring data in parent's traits for simulation engine to pick up
         if 'pending_offspring' not in parent.traits:
@@ -171,7 +174,7 @@ class ReproducingState(BehaviorState):
             'energy': inherited_energy,
             'happiness': inherited_happiness,  # Start with inherited happiness
             'parent_id': parent.id,
-            'created_at': time.time()
+            'created_at': world.last_update
         }
 
         parent.traits['pending_offspring'].append(offspring_data)
@@ -183,16 +186,16 @@ class DyingState(BehaviorState):
         creature.energy = 0
         creature.happiness = max(
             # Dying is very sad
-            0, creature.happiness - random.randint(15, 25))
+            0, creature.happiness - self.rng.randint(15, 25))
 
         # Mark death time
-        creature.traits['death_time'] = time.time()
+        creature.traits['death_time'] = world.last_update
         creature.traits['death_cause'] = self._determine_death_cause(creature)
 
     def update(self, creature: Creature, world: WorldState) -> Optional[CreatureState]:
         # Death is final - stay in dying state
         # Continue to lose happiness while dying
-        creature.happiness = max(0, creature.happiness - random.randint(1, 3))
+        creature.happiness = max(0, creature.happiness - self.rng.randint(1, 3))
         return None
 
     def exit(self, creature: Creature, world: WorldState) -> None:
@@ -210,33 +213,49 @@ class DyingState(BehaviorState):
 
 
 class BehaviorFSM:
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        rng = rng if rng is not None else random.Random()
         self.states: Dict[CreatureState, BehaviorState] = {
-            CreatureState.IDLE: IdleState(),
-            CreatureState.HUNGRY: HungryState(),
-            CreatureState.EATING: EatingState(),
-            CreatureState.REPRODUCING: ReproducingState(),
-            CreatureState.DYING: DyingState()
+            CreatureState.IDLE: IdleState(rng),
+            CreatureState.HUNGRY: HungryState(rng),
+            CreatureState.EATING: EatingState(rng),
+            CreatureState.REPRODUCING: ReproducingState(rng),
+            CreatureState.DYING: DyingState(rng)
         }
 
         # Track state transition statistics
         self.transition_counts = {}
 
+        # Creatures moved into DYING since the owner last took this list
+        self.dying: List[Creature] = []
+
+        # Dispatch tables built once: each state's bound update, and per
+        # (from, to) pair the statistics label plus the exit and enter to run
+        self._updates = {state: behavior.update
+                         for state, behavior in self.states.items()}
+        self._transitions = {
+            (old, new): (f"{old.value} -> {new.value}",
+                         self.states[old].exit, self.states[new].enter)
+            for old in self.states for new in self.states if old != new
+        }
+
     def update_creature(self, creature: Creature, world: WorldState) -> None:
         """Update creature behavior using finite state machine"""
-        current_state = self.states[creature.state]
-        new_state = current_state.update(creature, world)
+        state = creature.state
+        new_state = self._updates[state](creature, world)
+
+        if new_state and new_state != state:
+            label, exit_state, enter_state = self._transitions[state, new_state]
 
-        if new_state and new_state != creature.state:
             # Record transition for statistics
-            transition = f"{creature.state.value} -> {new_state.value}"
-            self.transition_counts[transition] = self.transition_counts.get(
-                transition, 0) + 1
+            self.transition_counts[label] = self.transition_counts.get(label, 0) + 1
 
             # Execute state transition
-            current_state.exit(creature, world)
+            exit_state(creature, world)
             creature.state = new_state
-            self.states[new_state].enter(creature, world)
+            enter_state(creature, world)
+            if new_state is CreatureState.DYING:
+                self.dying.append(creature)
 
     def get_transition_stats(self) -> Dict[str, int]:
         """Get statistics about state transitions"""
@@ -271,7 +290,7 @@ def process_pending_offspring(creatures: Dict[str, Creature], world: WorldState)
                         current_machine=creature.current_machine,
                         traits={
                             'parent_id': offspring_data['parent_id'],
-                            'birth_time': time.time(),
+                            'birth_time': world.last_update,
                             'generation': creature.traits.get('generation', 0) + 1
                         }
                     )
@@ -13,7 +13,7 @@ class CreatureState(Enum):
     DYING = "dying"
 
 
-@dataclass
+@dataclass(slots=True)
 class Creature:
     id: str
     name: str
@@ -35,6 +35,9 @@ class Creature:
             self.traits = {}
         if not self.last_fed:
             self.last_fed = time.time()
+        if not isinstance(self.state, CreatureState):
+            # Decoded from storage as its string value
+            self.state = CreatureState(self.state)
 
     # ADD THESE MIGRATION METHODS:
 
@@ -7,8 +7,27 @@ Handles interaction with external systems:
 - System integration
 """
 
-from .repository import FileRepository
+import importlib
+
+# Loaded on first access (PEP 562) so importing the framing helpers does
+# not drag in the domain model through the repository
+_LAZY_EXPORTS = {
+    "FileRepository": ".repository",
+}
 
 __all__ = [
     "FileRepository"
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
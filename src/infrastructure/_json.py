@@ -0,0 +1,56 @@
+"""
+JSON encoding helpers.
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+Both paths encode to UTF-8 bytes and decode from str or any bytes-like
+object, and both encode dataclasses as objects and enums as their values.
+"""
+
+try:
+    import orjson
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+    loads = orjson.loads
+
+except ImportError:
+    import dataclasses
+    import json
+    from enum import Enum
+    from operator import attrgetter
+
+    # Per-class (field names, attrgetter) so each instance is one C call
+    _dataclass_getters = {}
+
+    def _dataclass_getter(cls):
+        getter = _dataclass_getters.get(cls)
+        if getter is None:
+            names = tuple(field.name for field in dataclasses.fields(cls))
+            if len(names) == 1:
+                # attrgetter with one name returns the bare value, not a tuple
+                single = attrgetter(names[0])
+                getter = (names, lambda obj: (single(obj),))
+            else:
+                getter = (names, attrgetter(*names))
+            _dataclass_getters[cls] = getter
+        return getter
+
+    def _default(obj):
+        if isinstance(obj, Enum):
+            return obj.value
+        if dataclasses.is_dataclass(obj):
+            names, get = _dataclass_getter(type(obj))
+            return dict(zip(names, get(obj)))
+        raise TypeError(
+            f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None,
+                          default=_default).encode('utf-8')
+
+    def loads(data):
+        # json.loads takes bytes and bytearray but not other buffers
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import socket
+import struct
+from typing import Any, Optional, TYPE_CHECKING
+from . import _json
+
+if TYPE_CHECKING:
+    # Only used in annotations; the blocking client never needs asyncio
+    import asyncio
+
+# Every frame is a 4-byte big-endian length followed by the payload
+HEADER = struct.Struct('!I')
+
+# Above this size the header and payload go out as two buffers of one
+# sendmsg call instead of being joined into a copy first
+GATHER_SEND_THRESHOLD = 16 * 1024
+
+
+def recv_exact(sock: socket.socket, size: int) -> bytearray:
+    """Read exactly size bytes from sock into a presized buffer"""
+    buf = bytearray(size)
+    view = memoryview(buf)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:], size - received)
+        if not count:
+            raise ConnectionError("Connection closed mid-frame")
+        received += count
+    return buf
+
+
+def send_frame(sock: socket.socket, payload: bytes):
+    """Send a single length-prefixed frame"""
+    header = HEADER.pack(len(payload))
+    if len(payload) < GATHER_SEND_THRESHOLD or not hasattr(sock, 'sendmsg'):
+        sock.sendall(header + payload)
+        return
+
+    sent = sock.sendmsg([header, payload])
+    # sendmsg may stop short, finish whatever is left
+    if sent < len(header):
+        sock.sendall(header[sent:])
+        sent = len(header)
+    if sent - len(header) < len(payload):
+        sock.sendall(memoryview(payload)[sent - len(header):])
+
+
+def recv_frame(sock: socket.socket, max_size: Optional[int] = None) -> bytearray:
+    """Receive a single length-prefixed frame, rejecting ones over max_size"""
+    (size,) = HEADER.unpack(recv_exact(sock, HEADER.size))
+    if max_size is not None and size > max_size:
+        raise ValueError(f"Frame of {size} bytes exceeds limit of {max_size}")
+    return recv_exact(sock, size)
+
+
+def send_message(sock: socket.socket, message: Any):
+    """Encode message as JSON and send it as one frame"""
+    send_frame(sock, _json.dumps(message))
+
+
+def recv_message(sock: socket.socket) -> Any:
+    """Receive one frame and decode it as JSON"""
+    return _json.loads(recv_frame(sock))
+
+
+async def read_frame(reader: asyncio.StreamReader,
+                     max_size: Optional[int] = None) -> bytes:
+    """Receive a single length-prefixed frame from an asyncio stream
+
+    Frames over max_size are rejected before anything is read for them.
+    """
+    (size,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+    if max_size is not None and size > max_size:
+        raise ValueError(f"Frame of {size} bytes exceeds limit of {max_size}")
+    return await reader.readexactly(size)
+
+
+def write_frame(writer: asyncio.StreamWriter, payload: bytes):
+    """Queue a single length-prefixed frame on an asyncio stream"""
+    # Transports that support it send both buffers with one sendmsg
+    writer.writelines((HEADER.pack(len(payload)), payload))
@@ -1,44 +1,53 @@
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
-from enum import Enum
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Tuple
+import struct
+import sys
 import time
-import json
+from . import _json
 
 
-class MessageType(Enum):
+class MessageType:
+    """Wire names of message types, kept as plain strings for cheap decoding"""
     DISCOVERY = "discovery"
     DISCOVERY_RESPONSE = "discovery_response"
     HEARTBEAT = "heartbeat"
+    BULK_STATUS = "bulk_status"
     CREATURE_MIGRATION = "creature_migration"
     CREATURE_MIGRATION_ACK = "creature_migration_ack"
     RESOURCE_SHARE = "resource_share"
     WORLD_STATE_SYNC = "world_state_sync"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NetworkMessage:
-    message_type: MessageType
+    message_type: str
     sender_id: str
     recipient_id: Optional[str]
     timestamp: float
     payload: Dict[str, Any]
     message_id: str
+    # Encoded form, filled on first to_bytes() so resends skip re-encoding
+    _cached_bytes: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False)
 
-    def to_json(self) -> str:
-        return json.dumps({
-            'message_type': self.message_type.value,
-            'sender_id': self.sender_id,
-            'recipient_id': self.recipient_id,
-            'timestamp': self.timestamp,
-            'payload': self.payload,
-            'message_id': self.message_id
-        })
+    def to_bytes(self) -> bytes:
+        if self._cached_bytes is None:
+            # Frozen instance, the cache slot is the one field written later
+            object.__setattr__(self, '_cached_bytes', _json.dumps({
+                'message_type': self.message_type,
+                'sender_id': self.sender_id,
+                'recipient_id': self.recipient_id,
+                'timestamp': self.timestamp,
+                'payload': self.payload,
+                'message_id': self.message_id
+            }))
+        return self._cached_bytes
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'NetworkMessage':
-        data = json.loads(json_str)
+    def from_bytes(cls, raw: bytes) -> 'NetworkMessage':
+        data = _json.loads(raw)
         return cls(
-            message_type=MessageType(data['message_type']),
+            message_type=sys.intern(data['message_type']),
             sender_id=data['sender_id'],
             recipient_id=data['recipient_id'],
             timestamp=data['timestamp'],
@@ -47,7 +56,102 @@ class NetworkMessage:
         )
 
 
-@dataclass
+# Machine ids are hostnames cut to this length, which keeps them within the
+# one-byte length prefix of packed discovery and bounds what peers store
+MAX_MACHINE_ID_LENGTH = 63
+
+# Discovery datagrams have a fixed shape, peers speaking PACKED_DISCOVERY_VERSION
+# or later send them packed: magic, kind, timestamp, comm_port, population,
+# food, protocol major/minor, then sender, recipient and message id as
+# length-prefixed UTF-8 (an empty recipient is None). JSON starts with '{'
+# so the magic byte tells the two apart
+PACKED_DISCOVERY_VERSION = (1, 2)
+DISCOVERY_MAGIC = b'\xd7'
+_DISCOVERY_HEADER = struct.Struct('!cBdHIIBB')
+_DISCOVERY_KINDS = (MessageType.DISCOVERY, MessageType.DISCOVERY_RESPONSE)
+
+
+# Peers older than this exchange unframed TCP messages and can't be talked to
+FRAMED_PROTOCOL_VERSION = (1, 1)
+
+# Peers speaking this version or later answer BULK_STATUS, older ones hang up
+BULK_STATUS_VERSION = (1, 2)
+
+
+def _at_least(protocol_version: Optional[str], minimum: Tuple[int, int]) -> bool:
+    """Whether an advertised protocol_version is minimum or later"""
+    try:
+        version = tuple(int(part) for part in protocol_version.split('.'))
+    except (AttributeError, ValueError):
+        return False
+    return version >= minimum
+
+
+def supports_framing(protocol_version: Optional[str]) -> bool:
+    """Whether a peer advertising protocol_version speaks length-prefixed framing"""
+    return _at_least(protocol_version, FRAMED_PROTOCOL_VERSION)
+
+
+def supports_packed_discovery(protocol_version: Optional[str]) -> bool:
+    """Whether a peer advertising protocol_version understands packed discovery"""
+    return _at_least(protocol_version, PACKED_DISCOVERY_VERSION)
+
+
+def supports_bulk_status(protocol_version: Optional[str]) -> bool:
+    """Whether a peer advertising protocol_version answers BULK_STATUS"""
+    return _at_least(protocol_version, BULK_STATUS_VERSION)
+
+
+def pack_discovery(message: NetworkMessage) -> bytes:
+    """Encode a DISCOVERY or DISCOVERY_RESPONSE message in the packed form"""
+    payload = message.payload
+    major, minor = (int(part) for part in
+                    payload['protocol_version'].split('.')[:2])
+    parts = [_DISCOVERY_HEADER.pack(
+        DISCOVERY_MAGIC, _DISCOVERY_KINDS.index(message.message_type),
+        message.timestamp, payload['comm_port'], payload['population'],
+        payload['food'], major, minor)]
+    for text in (message.sender_id, message.recipient_id or '', message.message_id):
+        encoded = text.encode('utf-8')
+        parts.append(bytes((len(encoded),)))
+        parts.append(encoded)
+    return b''.join(parts)
+
+
+def unpack_discovery(raw) -> NetworkMessage:
+    """Decode a discovery datagram held in bytes or a memoryview, in either form"""
+    if raw[:1] != DISCOVERY_MAGIC:
+        return NetworkMessage.from_bytes(raw)
+
+    (_, kind, timestamp, comm_port, population, food,
+     major, minor) = _DISCOVERY_HEADER.unpack_from(raw)
+    start = _DISCOVERY_HEADER.size + 1
+    end = start + raw[start - 1]
+    sender_id = str(raw[start:end], 'utf-8')
+    start = end + 1
+    end = start + raw[start - 1]
+    recipient_id = str(raw[start:end], 'utf-8')
+    start = end + 1
+    end = start + raw[start - 1]
+    if end != len(raw):
+        raise ValueError("Malformed packed discovery datagram")
+    message_id = str(raw[start:end], 'utf-8')
+    return NetworkMessage(
+        message_type=_DISCOVERY_KINDS[kind],
+        sender_id=sender_id,
+        recipient_id=recipient_id or None,
+        timestamp=timestamp,
+        payload={
+            'comm_port': comm_port,
+            'population': population,
+            'food': food,
+            'protocol_version': f"{major}.{minor}"
+        },
+        message_id=message_id
+    )
+
+
+@dataclass(slots=True)
 class CreatureMigrationData:
     creature_data: Dict[str, Any]
     migration_reason: str = "random_walk"
@@ -1,9 +1,9 @@
-import json
 import os
 import time
 from typing import Dict, List, Any
 from pathlib import Path
-from ..domain.creature import Creature, CreatureState, WorldState
+from ..domain.creature import Creature, WorldState
+from . import _json
 
 
 class FileRepository:
@@ -14,58 +14,37 @@ class FileRepository:
         self.world_file = self.data_dir / "world_state.json"
         self.peers_file = self.data_dir / "network_peers.json"
 
+    def _write_atomic(self, path: Path, data: bytes):
+        """Write via a temp file and rename so a crash never leaves a torn file"""
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def encode_creatures(self, creatures: Dict[str, Creature]) -> bytes:
+        """Encode creatures the way save_creatures stores them"""
+        # Creature dataclasses are encoded directly, field names become keys
+        return _json.dumps(creatures, indent=True)
+
     def save_creatures(self, creatures: Dict[str, Creature]):
         """Save creatures to JSON file"""
-        serialized = {}
-        for creature_id, creature in creatures.items():
-            serialized[creature_id] = {
-                'id': creature.id,
-                'name': creature.name,
-                'age': creature.age,
-                'energy': creature.energy,
-                'happiness': creature.happiness,
-                'hunger': creature.hunger,
-                'current_machine': creature.current_machine,
-                'max_age': creature.max_age,
-                'state': creature.state.value,
-                'traits': creature.traits,
-                'last_fed': creature.last_fed,
-                'last_reproduced': creature.last_reproduced
-            }
-
-        with open(self.creatures_file, 'w') as f:
-            json.dump(serialized, f, indent=2)
+        self._write_atomic(self.creatures_file, self.encode_creatures(creatures))
 
     def load_creatures(self) -> Dict[str, Creature]:
         """Load creatures from JSON file"""
         if not self.creatures_file.exists():
             return {}
 
-        with open(self.creatures_file, 'r') as f:
-            data = json.load(f)
-
-        creatures = {}
-        for creature_id, creature_data in data.items():
-            creature = Creature(
-                id=creature_data['id'],
-                name=creature_data['name'],
-                age=creature_data['age'],
-                energy=creature_data['energy'],
-                happiness=creature_data['happiness'],
-                hunger=creature_data['hunger'],
-                current_machine=creature_data['current_machine'],
-                max_age=creature_data['max_age'],
-                state=CreatureState(creature_data['state']),
-                traits=creature_data['traits'],
-                last_fed=creature_data['last_fed'],
-                last_reproduced=creature_data['last_reproduced']
-            )
-            creatures[creature_id] = creature
-
-        return creatures
+        data = _json.loads(self.creatures_file.read_bytes())
 
-    def save_world_state(self, world_state: WorldState):
-        """Save world state to JSON file"""
+        # Stored objects carry exactly the Creature fields
+        return {creature_id: Creature(**fields)
+                for creature_id, fields in data.items()}
+
+    def encode_world_state(self, world_state: WorldState) -> bytes:
+        """Encode world state the way save_world_state stores it"""
         data = {
             'food': world_state.food,
             'max_food': world_state.max_food,
@@ -75,35 +54,40 @@ class FileRepository:
             'food_regen_rate': world_state.food_regen_rate,
             'last_update': world_state.last_update
         }
+        return _json.dumps(data, indent=True)
+
+    def save_world_state(self, world_state: WorldState):
+        """Save world state to JSON file"""
+        self._write_atomic(self.world_file, self.encode_world_state(world_state))
 
-        with open(self.world_file, 'w') as f:
-            json.dump(data, f, indent=2)
+    def save_encoded_state(self, creatures_data: bytes, world_data: bytes):
+        """Write creatures and world state already produced by the encode methods"""
+        self._write_atomic(self.creatures_file, creatures_data)
+        self._write_atomic(self.world_file, world_data)
 
     def load_world_state(self) -> WorldState:
         """Load world state from JSON file"""
         if not self.world_file.exists():
             return WorldState()
 
-        with open(self.world_file, 'r') as f:
-            data = json.load(f)
+        data = _json.loads(self.world_file.read_bytes())
 
         return WorldState(**data)
 
     def save_network_peers(self, peers: Dict[str, Any]):
         """Save network peers to JSON file"""
-        with open(self.peers_file, 'w') as f:
-            json.dump(peers, f, indent=2)
+        self._write_atomic(self.peers_file, _json.dumps(peers, indent=True))
 
     def load_network_peers(self) -> Dict[str, Any]:
         """Load network peers from JSON file"""
         if not self.peers_file.exists():
             return {}
 
-        with open(self.peers_file, 'r') as f:
-            return json.load(f)
+        return _json.loads(self.peers_file.read_bytes())
 
     def save_migration_log(self, migration_event: Dict[str, Any]):
         """Log migration events for debugging"""
         log_file = self.data_dir / "migrations.log"
-        with open(log_file, 'a') as f:
-            f.write(f"{time.time()}: {json.dumps(migration_event)}\n")
+        with open(log_file, 'ab') as f:
+            f.write(f"{time.time()}: ".encode('utf-8') +
+                    _json.dumps(migration_event) + b"\n")
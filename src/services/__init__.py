@@ -7,10 +7,17 @@ Contains the core application logic:
 - IPC communication between daemon and CLI
 """
 
-from .simulation import SimulationEngine
-from .network import NetworkManager, NetworkPeer
-from .daemon_server import DaemonServer
-from .daemon_client import DaemonClient
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562) so the CLI,
+# which only needs DaemonClient, does not pull in the simulation stack
+_LAZY_EXPORTS = {
+    "SimulationEngine": ".simulation",
+    "NetworkManager": ".network",
+    "NetworkPeer": ".network",
+    "DaemonServer": ".daemon_server",
+    "DaemonClient": ".daemon_client",
+}
 
 __all__ = [
     "SimulationEngine",
@@ -19,3 +26,16 @@ __all__ = [
     "DaemonServer",
     "DaemonClient"
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
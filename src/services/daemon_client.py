@@ -1,12 +1,80 @@
+import os
+import queue
 import socket
-import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+from ..infrastructure.framing import send_message, recv_message
+from config.network_config import (
+    DAEMON_IPC_PORT, DAEMON_SOCKET_PATH, DAEMON_REQUEST_TIMEOUT)
 
 
 class DaemonClient:
-    def __init__(self, host: str = 'localhost', port: int = 7892):
+    def __init__(self, host: str = 'localhost', port: int = DAEMON_IPC_PORT,
+                 socket_path: Optional[str] = DAEMON_SOCKET_PATH,
+                 pool_size: int = 4, timeout: Optional[float] = DAEMON_REQUEST_TIMEOUT):
         self.host = host
         self.port = port
+        self.socket_path = socket_path
+        self.timeout = timeout
+        # Idle connections kept open between commands
+        self._idle: queue.Queue = queue.Queue(maxsize=pool_size)
+
+    def __enter__(self) -> 'DaemonClient':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close all pooled connections"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _use_unix_socket(self) -> bool:
+        """Prefer the daemon's UNIX socket when it is present"""
+        return (self.socket_path is not None and hasattr(socket, 'AF_UNIX')
+                and os.path.exists(self.socket_path))
+
+    def _connect(self, timeout: Optional[float] = None) -> socket.socket:
+        """Open a connection to the daemon"""
+        if self._use_unix_socket():
+            try:
+                return self._open(socket.AF_UNIX, self.socket_path, timeout)
+            except (PermissionError, ConnectionRefusedError, FileNotFoundError):
+                # Socket is owner-only, stale, or just went away; the TCP
+                # listener serves everyone else
+                pass
+        return self._open(socket.AF_INET, (self.host, self.port), timeout)
+
+    def _open(self, family: int, address, timeout: Optional[float]) -> socket.socket:
+        """Connect a new stream socket of the given family to address"""
+        client_socket = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            if family == socket.AF_INET:
+                client_socket.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client_socket.settimeout(timeout)
+            client_socket.connect(address)
+        except OSError:
+            client_socket.close()
+            raise
+        return client_socket
+
+    def _acquire(self) -> Tuple[socket.socket, bool]:
+        """Take an idle pooled connection, or open a new one"""
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._connect(self.timeout), False
+
+    def _release(self, client_socket: socket.socket):
+        """Return a healthy connection to the pool"""
+        try:
+            self._idle.put_nowait(client_socket)
+        except queue.Full:
+            client_socket.close()
 
     def send_command(self, command: str, **kwargs) -> Optional[Dict[str, Any]]:
         """Send command to daemon and return response"""
@@ -14,19 +82,28 @@ class DaemonClient:
             # Create request
             request = {"command": command, **kwargs}
 
-            # Connect to daemon
-            client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            client_socket.connect((self.host, self.port))
-
-            # Send request
-            client_socket.send(json.dumps(request).encode('utf-8'))
+            while True:
+                client_socket, reused = self._acquire()
+                try:
+                    send_message(client_socket, request)
+                    response = recv_message(client_socket)
+                except TimeoutError:
+                    # The daemon may still act on it, so don't send it again
+                    client_socket.close()
+                    raise
+                except OSError:
+                    client_socket.close()
+                    if not reused:
+                        raise
+                    # Pooled connection went stale (e.g. daemon restarted)
+                    continue
+                except Exception:
+                    # Malformed or truncated reply, the connection is unusable
+                    client_socket.close()
+                    raise
 
-            # Receive response
-            response_data = client_socket.recv(4096).decode('utf-8')
-            response = json.loads(response_data)
-
-            client_socket.close()
-            return response
+                self._release(client_socket)
+                return response
 
         except Exception as e:
             print(f"Error communicating with daemon: {e}")
@@ -35,10 +112,8 @@ class DaemonClient:
     def is_daemon_running(self) -> bool:
         """Check if daemon is accessible"""
         try:
-            client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            client_socket.settimeout(1)
-            result = client_socket.connect_ex((self.host, self.port))
+            client_socket = self._connect(timeout=1)
             client_socket.close()
-            return result == 0
+            return True
         except:
             return False
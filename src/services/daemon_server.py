@@ -1,114 +1,325 @@
+import asyncio
+import os
+import random
 import socket
-import json
 import threading
-from typing import Dict, Any
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
+from operator import attrgetter
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
 import logging
 import time
+from ..infrastructure import _json
+from ..infrastructure.framing import read_frame, write_frame
+from ..infrastructure.network_protocol import NetworkMessage, MessageType
+from config.network_config import (
+    DAEMON_IPC_PORT, DAEMON_SOCKET_PATH, DAEMON_MAX_WORKERS, DAEMON_MAX_REQUEST_SIZE,
+    PEER_QUERY_TIMEOUT, PEER_STATUS_MAX_AGE)
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# How long polled read-only responses are reused before being rebuilt
+OVERVIEW_TTL_SEC = 0.5
+STATUS_TTL_SEC = 0.1
+
+# Where NetworkManager may be writing its migration log, in order of preference
+MIGRATION_LOG_PATHS = (
+    Path("/opt/thronglet/data/migrations.log"),
+    Path("data/migrations.log"),
+)
+RECENT_MIGRATIONS = 10
+LOG_READ_CHUNK = 64 * 1024
+
+# Fields of a creature sent by the list command, fetched in one call
+_creature_row = attrgetter('id', 'name', 'age', 'max_age', 'energy',
+                           'hunger', 'happiness', 'state')
 
 
 class DaemonServer:
-    def __init__(self, simulation_engine, port: int = 7892):
+    def __init__(self, simulation_engine, port: int = DAEMON_IPC_PORT,
+                 socket_path: Optional[str] = DAEMON_SOCKET_PATH,
+                 max_workers: int = DAEMON_MAX_WORKERS):
         self.simulation = simulation_engine
         self.port = port
+        self.socket_path = socket_path
+        self.max_workers = max_workers
+        self._bound_path = None
         self.running = False
         self.server_socket = None
+        self.unix_socket = None
         self.server_thread = None
+        self._loop = None
+        self._pool = None
+        self._peer_pool = None
+        # machine_id -> query still running against that peer; later
+        # overviews wait on it rather than queueing another
+        self._peer_queries: Dict[str, Future] = {}
+        self._peer_queries_lock = threading.Lock()
+        self._writers = set()
         self.logger = logging.getLogger(__name__)
 
+        # name -> (built_at, response) for TTL-cached responses
+        self._response_cache = {}
+        self._cache_locks = {
+            'status': threading.Lock(),
+            'network_overview': threading.Lock(),
+        }
+
+        # Migration log scan state, so each read only covers appended lines
+        self._migration_log_path = None
+        self._migration_log_pos = 0
+        self._migration_total = 0
+        self._recent_migrations = deque(maxlen=RECENT_MIGRATIONS)
+
+        # Process-constant pieces of responses, computed once
+        self._machine_id = simulation_engine.get_machine_id()
+        self._empty_network_response = _json.dumps({
+            "machine_id": self._machine_id,
+            "connected_peers": 0,
+            "peers": []
+        })
+
+        # Command dispatch table, each handler takes the request dict
+        self._handlers = {
+            'status': partial(self._cached_response,
+                              'status', STATUS_TTL_SEC, self._get_status),
+            'list': self._list_creatures,
+            'add': self._add_creature,
+            'network': self._get_network_status,
+            'network_overview': partial(self._cached_response, 'network_overview',
+                                        OVERVIEW_TTL_SEC, self._get_network_overview),
+            'stats': self._get_detailed_stats,
+            'feed_all': self._feed_all_creatures,
+            'force_reproduce': self._force_reproduction,
+            'force_migration': self._force_migration,
+        }
+
     def start(self):
         """Start the IPC server"""
         self.running = True
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.setsockopt(
-            socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.server_socket.bind(('localhost', self.port))
-        self.server_socket.listen(5)
-
-        self.server_thread = threading.Thread(target=self._server_loop)
+        # Local clients use the UNIX socket, TCP stays up for everyone else
+        self.unix_socket = self._create_unix_socket()
+        try:
+            self.server_socket = self._create_tcp_socket()
+        except OSError as e:
+            if not self.unix_socket:
+                raise
+            self.logger.warning(
+                f"Could not bind IPC port {self.port} ({e}), serving {self._bound_path} only")
+            self.server_socket = None
+        self._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        # Bounded worker pool for handlers so a burst of clients cannot
+        # spawn unbounded threads
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='thronglet-ipc')
+        # Separate pool for peer status queries, so an overview waiting on
+        # peers never starves the handler pool it is running on
+        self._peer_pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='thronglet-peer')
+
+        self.server_thread = threading.Thread(target=self._run_loop)
         self.server_thread.daemon = True
         self.server_thread.start()
-        print(f"Daemon IPC server started on port {self.port}")
+        print(f"Daemon IPC server started on {self.describe_endpoints()}")
+
+    def describe_endpoints(self) -> str:
+        """Human readable list of where the IPC server is listening"""
+        endpoints = []
+        if self._bound_path:
+            endpoints.append(self._bound_path)
+        if self.server_socket:
+            endpoints.append(f"port {self.port}")
+        return " and ".join(endpoints)
 
     def stop(self):
         """Stop the IPC server"""
         self.running = False
-        if self.server_socket:
-            self.server_socket.close()
+        if self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._loop.stop)
         if self.server_thread:
             self.server_thread.join()
+        if self._pool:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        if self._peer_pool:
+            self._peer_pool.shutdown(wait=False, cancel_futures=True)
+            self._peer_pool = None
+        with self._peer_queries_lock:
+            self._peer_queries.clear()
+        if self._bound_path:
+            Path(self._bound_path).unlink(missing_ok=True)
+            self._bound_path = None
+
+    def _create_unix_socket(self) -> Optional[socket.socket]:
+        """Bind a UNIX domain socket for local clients, if supported"""
+        if not self.socket_path or not hasattr(socket, 'AF_UNIX'):
+            return None
+
+        path = Path(self.socket_path)
+        if self._socket_in_use(path):
+            raise RuntimeError(f"Thronglet daemon already running on {path}")
 
-    def _server_loop(self):
-        """Main server loop"""
-        while self.running:
-            try:
-                client_socket, addr = self.server_socket.accept()
-                threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket,),
-                    daemon=True
-                ).start()
-            except Exception as e:
-                if self.running:  # Only log if we're supposed to be running
-                    print(f"Server error: {e}")
-
-    def _handle_client(self, client_socket):
-        """Handle individual client requests"""
+        server_socket = None
         try:
-            # Receive request
-            data = client_socket.recv(4096).decode('utf-8')
-            request = json.loads(data)
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server_socket.bind(str(path))
+            os.chmod(path, 0o600)
+            # Listen now so clients queue while the event loop starts up
+            server_socket.listen(128)
+        except OSError as e:
+            if server_socket:
+                server_socket.close()
+            self.logger.warning(
+                f"Could not bind IPC socket {path} ({e}), serving TCP only")
+            return None
 
-            # Process request
-            response = self._process_request(request)
+        self._bound_path = str(path)
+        return server_socket
 
-            # Send response
-            client_socket.send(json.dumps(response).encode('utf-8'))
+    def _socket_in_use(self, path: Path) -> bool:
+        """Check for a live daemon on path, removing the socket if it is stale"""
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(path))
+        except FileNotFoundError:
+            return False
+        except ConnectionRefusedError:
+            # Nobody is listening, left behind by a previous run
+            path.unlink(missing_ok=True)
+            return False
+        except OSError:
+            # Not ours to judge, let the bind report it
+            return False
+        finally:
+            probe.close()
+        return True
+
+    def _create_tcp_socket(self) -> socket.socket:
+        """Bind the TCP fallback on localhost"""
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            server_socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Accepted connections inherit this on Linux, asyncio sets it again
+            server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            server_socket.bind(('localhost', self.port))
+            server_socket.listen(128)
+        except OSError:
+            server_socket.close()
+            raise
+        return server_socket
+
+    def _run_loop(self):
+        """Run the asyncio event loop serving IPC clients"""
+        asyncio.set_event_loop(self._loop)
+        servers = []
+        try:
+            # A stop() that lands while these start makes them raise, which
+            # still has to clean up below
+            if self.unix_socket:
+                servers.append(self._loop.run_until_complete(asyncio.start_unix_server(
+                    self._handle_client, sock=self.unix_socket, backlog=128)))
+            if self.server_socket:
+                servers.append(self._loop.run_until_complete(asyncio.start_server(
+                    self._handle_client, sock=self.server_socket, backlog=128)))
+
+            self._loop.run_forever()
+        except RuntimeError:
+            if self.running:
+                raise
+        finally:
+            for server in servers:
+                server.close()
+            # Sockets no server took over yet
+            for server_socket in (self.unix_socket, self.server_socket):
+                if server_socket:
+                    server_socket.close()
+            # Hang up on open connections and let in-flight requests finish
+            for writer in list(self._writers):
+                writer.close()
+            tasks = asyncio.all_tasks(self._loop)
+            self._loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.close()
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter):
+        """Serve requests on a client connection until the client closes it"""
+        loop = asyncio.get_running_loop()
+        self._writers.add(writer)
+        try:
+            while True:
+                # Receive request
+                request = _json.loads(
+                    await read_frame(reader, DAEMON_MAX_REQUEST_SIZE))
+
+                # Process request off the event loop, handlers may block on peers
+                try:
+                    response = await loop.run_in_executor(
+                        self._pool, self._process_request, request)
+                except Exception as e:
+                    response = {"error": str(e)}
+
+                # Send response, handlers may return an already encoded body
+                if not isinstance(response, bytes):
+                    response = _json.dumps(response)
+                write_frame(writer, response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # Client hung up, e.g. an is_daemon_running() probe
         except Exception as e:
             error_response = {"error": str(e)}
-            client_socket.send(json.dumps(error_response).encode('utf-8'))
+            write_frame(writer, _json.dumps(error_response))
         finally:
-            client_socket.close()
+            self._writers.discard(writer)
+            writer.close()
 
-    def _process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_request(self, request: Dict[str, Any]) -> Union[Dict[str, Any], bytes]:
         """Process incoming requests"""
         command = request.get('command')
-
-        if command == 'status':
-            return self._get_status()
-        elif command == 'list':
-            return self._list_creatures()
-        elif command == 'add':
-            name = request.get('name')
-            return self._add_creature(name)
-        elif command == 'network':
-            return self._get_network_status()
-        elif command == 'network_overview':  # NEW COMMAND
-            return self._get_network_overview()
-        elif command == 'stats':
-            return self._get_detailed_stats()
-        elif command == 'feed_all':
-            return self._feed_all_creatures()
-        elif command == 'force_reproduce':
-            creature_id = request.get('creature_id')
-            return self._force_reproduction(creature_id)
-        elif command == 'force_migration':
-            creature_name = request.get('creature_name')
-            return self._force_migration(creature_name)
-        else:
+        handler = self._handlers.get(command)
+        if handler is None:
             return {"error": f"Unknown command: {command}"}
-
-    def _get_network_overview(self) -> Dict[str, Any]:
+        return handler(request)
+
+    def _cached_response(self, name: str, ttl: float, build,
+                         request: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a recently built response, rebuilding it once it is ttl old"""
+        cached = self._response_cache.get(name)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        with self._cache_locks[name]:
+            # Another worker may have rebuilt it while we waited for the lock
+            cached = self._response_cache.get(name)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+            response = build(request)
+            if "error" not in response:
+                self._response_cache[name] = (time.monotonic(), response)
+            return response
+
+    def _get_network_overview(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Get comprehensive network overview including all peer data"""
         try:
             # Start with local machine data
-            local_data = {
-                self.simulation.get_machine_id(): {
+            world = self.simulation.world_state
+            ecosystem_data = {
+                self._machine_id: {
                     'host': 'localhost',
                     'population': len(self.simulation.creatures),
-                    'max_population': self.simulation.world_state.max_population,
-                    'food': self.simulation.world_state.food,
-                    'max_food': self.simulation.world_state.max_food,
-                    'temperature': self.simulation.world_state.temperature,
+                    'max_population': world.max_population,
+                    'food': world.food,
+                    'max_food': world.max_food,
+                    'temperature': world.temperature,
                     'last_seen': time.time(),
                     'is_local': True,
                     'state_counts': self._get_state_counts()
@@ -116,25 +327,47 @@ class DaemonServer:
             }
 
             # Collect data from all connected peers
-            ecosystem_data = local_data.copy()
-
             if self.simulation.network_manager:
                 peers = self.simulation.network_manager.get_connected_peers()
 
+                # Every peer query shares one deadline; a peer that misses it
+                # is left out of this overview instead of stalling it
+                deadline = time.monotonic() + PEER_QUERY_TIMEOUT
+
+                # Only peers without a recent detailed status need asking.
+                # One bulk request to the freshest of them may cover the rest
+                stale = [peer for peer in peers
+                         if peer.status_age() >= PEER_STATUS_MAX_AGE]
+                bulk_peers = [peer for peer in stale if peer.bulk_status]
+                if len(stale) > 1 and bulk_peers:
+                    wait([self._peer_query(
+                        self._query_bulk_status,
+                        max(bulk_peers, key=lambda peer: peer.last_seen))],
+                        timeout=deadline - time.monotonic())
+                    stale = [peer for peer in stale
+                             if peer.status_age() >= PEER_STATUS_MAX_AGE]
+
+                # Query the rest at once
+                futures = [self._peer_query(self._query_peer_status, peer)
+                           for peer in stale]
+                if futures:
+                    wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+
                 for peer in peers:
-                    # Query each peer for their detailed status
-                    peer_data = self._query_peer_status(peer)
+                    peer_data = peer.detailed_status \
+                        if peer.status_age() < PEER_STATUS_MAX_AGE else None
                     if peer_data:
+                        get = peer_data.get
                         ecosystem_data[peer.machine_id] = {
                             'host': peer.host,
-                            'population': peer_data.get('population', peer.population_count),
-                            'max_population': peer_data.get('max_population', 50),
-                            'food': peer_data.get('food', peer.available_food),
-                            'max_food': peer_data.get('max_food', 100),
-                            'temperature': peer_data.get('temperature', 20),
+                            'population': get('population', peer.population_count),
+                            'max_population': get('max_population', 50),
+                            'food': get('food', peer.available_food),
+                            'max_food': get('max_food', 100),
+                            'temperature': get('temperature', 20),
                             'last_seen': peer.last_seen,
                             'is_local': False,
-                            'state_counts': peer_data.get('state_counts', {})
+                            'state_counts': get('state_counts', {})
                         }
 
             # Get migration activity data
@@ -150,6 +383,24 @@ class DaemonServer:
             self.logger.error(f"Error getting network overview: {e}")
             return {"error": f"Failed to get network overview: {str(e)}"}
 
+    def _peer_query(self, query, peer) -> Future:
+        """Run query(peer) on the peer pool unless one is already in flight for peer"""
+        with self._peer_queries_lock:
+            future = self._peer_queries.get(peer.machine_id)
+            if future is not None:
+                return future
+            future = self._peer_pool.submit(query, peer)
+            self._peer_queries[peer.machine_id] = future
+        # Outside the lock, the callback runs right here if it already finished
+        future.add_done_callback(partial(self._forget_peer_query, peer.machine_id))
+        return future
+
+    def _forget_peer_query(self, machine_id: str, future: Future):
+        """Drop a finished query so the next overview may ask the peer again"""
+        with self._peer_queries_lock:
+            if self._peer_queries.get(machine_id) is future:
+                del self._peer_queries[machine_id]
+
     def _query_peer_status(self, peer) -> Dict[str, Any]:
         """Query a specific peer for detailed status information"""
         try:
@@ -157,16 +408,13 @@ class DaemonServer:
                 return None
 
             # Create status request message
-            from ..infrastructure.network_protocol import NetworkMessage, MessageType
-            import uuid
-
             status_request = NetworkMessage(
                 message_type=MessageType.HEARTBEAT,  # Reuse heartbeat for status
-                sender_id=self.simulation.get_machine_id(),
+                sender_id=self._machine_id,
                 recipient_id=peer.machine_id,
                 timestamp=time.time(),
                 payload={'request_detailed_status': True},
-                message_id=str(uuid.uuid4())
+                message_id=self.simulation.network_manager.next_message_id()
             )
 
             # Send request and get response
@@ -174,6 +422,7 @@ class DaemonServer:
                 peer, status_request)
 
             if response and response.payload:
+                peer.record_detailed_status(response.payload)
                 return response.payload
 
             return None
@@ -182,13 +431,38 @@ class DaemonServer:
             self.logger.error(f"Error querying peer {peer.machine_id}: {e}")
             return None
 
+    def _query_bulk_status(self, peer):
+        """Ask one peer for every detailed status it knows and cache the fresh ones"""
+        try:
+            network_manager = self.simulation.network_manager
+            bulk_request = NetworkMessage(
+                message_type=MessageType.BULK_STATUS,
+                sender_id=self._machine_id,
+                recipient_id=peer.machine_id,
+                timestamp=time.time(),
+                payload={},
+                message_id=network_manager.next_message_id()
+            )
+
+            # A peer that fails to answer leaves every peer stale, which
+            # falls back to querying them one by one
+            response = network_manager._send_reliable_message(peer, bulk_request)
+            if not response or response.message_type != MessageType.BULK_STATUS:
+                return
+
+            known_peers = network_manager.peers
+            for machine_id, entry in response.payload.get('statuses', {}).items():
+                known = known_peers.get(machine_id)
+                if known is not None and entry.get('status'):
+                    known.record_detailed_status(
+                        entry['status'], entry.get('age', 0.0))
+
+        except Exception as e:
+            self.logger.error(f"Error querying bulk status from {peer.machine_id}: {e}")
+
     def _get_state_counts(self) -> Dict[str, int]:
         """Get count of creatures in each state"""
-        state_counts = {}
-        for creature in self.simulation.creatures.values():
-            state = creature.state.value
-            state_counts[state] = state_counts.get(state, 0) + 1
-        return state_counts
+        return self.simulation.get_state_counts()
 
     def _get_migration_activity(self) -> Dict[str, Any]:
         """Get migration activity statistics"""
@@ -202,46 +476,111 @@ class DaemonServer:
 
         # Check if we have migration logs
         try:
-            from pathlib import Path
-            migration_log = Path("/opt/thronglet/data/migrations.log")
-            if not migration_log.exists():
-                migration_log = Path("data/migrations.log")
-
-            if migration_log.exists():
-                # Read recent migration events
-                with open(migration_log, 'r') as f:
-                    lines = f.readlines()
-
-                migration_data['total_migrations'] = len(lines)
-
-                # Parse recent migrations (last 10)
-                recent_lines = lines[-10:] if len(lines) > 10 else lines
-                for line in recent_lines:
-                    try:
-                        import json
-                        timestamp, event_json = line.strip().split(': ', 1)
-                        event = json.loads(event_json)
-                        migration_data['recent_migrations'].append(event)
-                    except:
-                        continue  # Skip malformed lines
+            migration_log = self._find_migration_log()
+            if migration_log:
+                self._scan_migration_log(migration_log)
+                migration_data['total_migrations'] = self._migration_total
+                migration_data['recent_migrations'] = [
+                    event for event in self._recent_migrations if event is not None]
 
         except Exception as e:
             self.logger.error(f"Error reading migration activity: {e}")
 
         return migration_data
 
-    def _force_migration(self, creature_name: str = None) -> Dict[str, Any]:
+    def _find_migration_log(self) -> Optional[Path]:
+        """Locate the migration log, sticking with it once found"""
+        if self._migration_log_path and self._migration_log_path.exists():
+            return self._migration_log_path
+        for migration_log in MIGRATION_LOG_PATHS:
+            if migration_log.exists():
+                return migration_log
+        return None
+
+    def _scan_migration_log(self, migration_log: Path):
+        """Pick up complete lines appended to the migration log since the last scan"""
+        if migration_log != self._migration_log_path:
+            self._reset_migration_scan(migration_log)
+
+        with open(migration_log, 'rb') as f:
+            end = f.seek(0, os.SEEK_END)
+            if end < self._migration_log_pos:
+                # Truncated or rotated, start over
+                self._reset_migration_scan(migration_log)
+
+            start = self._migration_log_pos
+            if end == start:
+                return
+
+            # Count new lines, stopping at the last newline so a
+            # half-written entry is picked up on the next scan
+            f.seek(start)
+            offset = start
+            new_lines = 0
+            last_newline = -1
+            while offset < end:
+                chunk = f.read(min(LOG_READ_CHUNK, end - offset))
+                if not chunk:
+                    break
+                new_lines += chunk.count(b'\n')
+                index = chunk.rfind(b'\n')
+                if index != -1:
+                    last_newline = offset + index
+                offset += len(chunk)
+
+            if last_newline < 0:
+                return
+            scanned_end = last_newline + 1
+
+            # Only the newest entries are parsed, read backwards from the end.
+            # Malformed lines keep their slot as None so the window stays
+            # the last RECENT_MIGRATIONS lines of the file
+            for line in self._read_tail_lines(f, start, scanned_end, RECENT_MIGRATIONS):
+                try:
+                    # A line without the separator leaves event_json empty,
+                    # which fails to parse like any other malformed entry
+                    timestamp, _, event_json = line.partition(b': ')
+                    event = _json.loads(event_json)
+                except:
+                    event = None  # Skip malformed lines
+                self._recent_migrations.append(event)
+
+            self._migration_total += new_lines
+            self._migration_log_pos = scanned_end
+
+    def _reset_migration_scan(self, migration_log: Path):
+        """Forget what was scanned so the log is read again from the start"""
+        self._migration_log_path = migration_log
+        self._migration_log_pos = 0
+        self._migration_total = 0
+        self._recent_migrations.clear()
+
+    @staticmethod
+    def _read_tail_lines(f, start: int, end: int, count: int) -> List[bytes]:
+        """Return up to the last count lines between start and end of f"""
+        data = b''
+        pos = end
+        # One extra newline guarantees the first kept line is complete
+        while pos > start and data.count(b'\n') <= count:
+            step = min(LOG_READ_CHUNK, pos - start)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+        return data.splitlines()[-count:]
+
+    def _force_migration(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Force migration of a specific creature"""
-        # Debug logging
-        self.logger.info(f"Force migration requested for: {creature_name}")
-        self.logger.info(f"Network manager available: {
-                         self.simulation.network_manager is not None}")
+        creature_name = request.get('creature_name')
+        # Debug logging, formatted only if the record is emitted
+        self.logger.debug("Force migration requested for: %s", creature_name)
+        self.logger.debug("Network manager available: %s",
+                          self.simulation.network_manager is not None)
 
         if not hasattr(self.simulation, 'network_manager') or self.simulation.network_manager is None:
             return {"error": "Network manager not available. Make sure daemon was started properly."}
 
         peers = self.simulation.network_manager.get_connected_peers()
-        self.logger.info(f"Connected peers: {len(peers)}")
+        self.logger.debug("Connected peers: %d", len(peers))
 
         if not peers:
             return {"error": "No connected peers for migration. Start daemon on another machine first."}
@@ -249,22 +588,21 @@ class DaemonServer:
         # Find creature to migrate
         target_creature = None
         if creature_name:
-            # Find by name
-            for creature in self.simulation.creatures.values():
-                if creature.name == creature_name:
-                    target_creature = creature
-                    break
+            target_creature = self.simulation.get_creature_by_name(
+                creature_name)
             if not target_creature:
                 available_names = [
                     c.name for c in self.simulation.creatures.values()]
                 return {"error": f"Creature '{creature_name}' not found. Available: {available_names}"}
         else:
-            # Find random eligible creature
-            eligible = [c for c in self.simulation.creatures.values()
-                        if c.can_migrate()]
-            if eligible:
-                import random
-                target_creature = random.choice(eligible)
+            # Pick a random eligible creature in one pass (reservoir
+            # sampling) without building the list of candidates
+            eligible_seen = 0
+            for creature in self.simulation.creatures.values():
+                if creature.can_migrate():
+                    eligible_seen += 1
+                    if random.random() * eligible_seen < 1.0:
+                        target_creature = creature
 
         if not target_creature:
             return {"error": "No eligible creatures for migration. Creatures must be age > 50, energy > 30, and not dying/reproducing."}
@@ -277,8 +615,8 @@ class DaemonServer:
         if not best_peer:
             return {"error": "No suitable migration target found"}
 
-        self.logger.info(f"Attempting migration of {
-                         target_creature.name} to {best_peer.machine_id}")
+        self.logger.info("Attempting migration of %s to %s",
+                         target_creature.name, best_peer.machine_id)
         success = self.simulation.network_manager._migrate_creature(
             target_creature, best_peer)
 
@@ -287,16 +625,13 @@ class DaemonServer:
             "message": f"{'Successfully migrated' if success else 'Failed to migrate'} {target_creature.name} to {best_peer.machine_id}"
         }
 
-    def _get_status(self) -> Dict[str, Any]:
+    def _get_status(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Get simulation status"""
         creatures = self.simulation.creatures
         world = self.simulation.world_state
 
         # State breakdown
-        state_counts = {}
-        for creature in creatures.values():
-            state = creature.state.value
-            state_counts[state] = state_counts.get(state, 0) + 1
+        state_counts = self._get_state_counts()
 
         return {
             "population": len(creatures),
@@ -304,35 +639,36 @@ class DaemonServer:
             "food": world.food,
             "max_food": world.max_food,
             "temperature": world.temperature,
-            "machine_id": self.simulation.get_machine_id(),
+            "machine_id": self._machine_id,
             "state_counts": state_counts
         }
 
-    def _list_creatures(self) -> Dict[str, Any]:
+    def _list_creatures(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """List all creatures"""
-        creatures = self.simulation.creatures
-        creature_list = []
-
-        for creature in creatures.values():
-            creature_list.append({
-                "id": creature.id,
-                "name": creature.name,
-                "age": creature.age,
-                "max_age": creature.max_age,
-                "energy": creature.energy,
-                "hunger": creature.hunger,
-                "happiness": creature.happiness,
-                "state": creature.state.value
-            })
+        creatures = list(self.simulation.creatures.values())
+        creature_list = [
+            {
+                "id": creature_id,
+                "name": name,
+                "age": age,
+                "max_age": max_age,
+                "energy": energy,
+                "hunger": hunger,
+                "happiness": happiness,
+                "state": state.value
+            }
+            for creature_id, name, age, max_age, energy, hunger, happiness, state
+            in map(_creature_row, creatures)
+        ]
 
         return {
             "count": len(creatures),
             "creatures": creature_list
         }
 
-    def _add_creature(self, name: str = None) -> Dict[str, Any]:
+    def _add_creature(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Add new creature"""
-        creature = self.simulation.add_creature(name)
+        creature = self.simulation.add_creature(request.get('name'))
         return {
             "success": True,
             "creature": {
@@ -341,20 +677,11 @@ class DaemonServer:
             }
         }
 
-    def _get_network_status(self) -> Dict[str, Any]:
-        """Get network status"""
-        # This would integrate with NetworkManager
-        return {
-            "machine_id": self.simulation.get_machine_id(),
-            "connected_peers": 0,  # Placeholder
-            "peers": []
-        }
-
-    def _get_detailed_stats(self) -> Dict[str, Any]:
+    def _get_detailed_stats(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Get comprehensive simulation statistics"""
         return self.simulation.get_simulation_stats()
 
-    def _feed_all_creatures(self) -> Dict[str, Any]:
+    def _feed_all_creatures(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Emergency feeding for all creatures"""
         fed_count = self.simulation.feed_all_creatures()
         return {
@@ -363,8 +690,9 @@ class DaemonServer:
             "message": f"Fed {fed_count} hungry creatures"
         }
 
-    def _force_reproduction(self, creature_id: str) -> Dict[str, Any]:
+    def _force_reproduction(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Force a creature to reproduce"""
+        creature_id = request.get('creature_id')
         if not creature_id:
             return {"error": "creature_id required"}
 
@@ -374,9 +702,11 @@ class DaemonServer:
             "message": f"Reproduction {'initiated' if success else 'failed'} for creature {creature_id[:8]}"
         }
 
-    def _get_network_status(self) -> Dict[str, Any]:
+    def _get_network_status(self, request: Dict[str, Any]) -> Union[Dict[str, Any], bytes]:
         """Get network status including peer information"""
         network_status = self.simulation.get_network_status()
+        if not network_status['connected_peers']:
+            return self._empty_network_response
 
         return {
             "machine_id": network_status['machine_id'],
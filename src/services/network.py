@@ -1,14 +1,49 @@
 import socket
-import json
+import heapq
 import threading
 import time
-import uuid
+import hashlib
+import itertools
 import ipaddress
-from typing import Dict, List, Optional, Callable, Any
+import queue
+import select
+import selectors
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Callable, Any, Tuple
 import logging
-from ..infrastructure.network_protocol import NetworkMessage, MessageType, CreatureMigrationData
+from pathlib import Path
+from ..infrastructure import _json
+from ..infrastructure.network_protocol import (
+    NetworkMessage, MessageType, CreatureMigrationData, MAX_MACHINE_ID_LENGTH,
+    pack_discovery, unpack_discovery, supports_framing,
+    supports_packed_discovery, supports_bulk_status)
+from ..infrastructure.framing import send_frame, recv_frame
 from config.network_config import *
 
+_IPV4 = struct.Struct('!I')
+
+# Most discovery datagrams read per wakeup before the broadcast timer is checked
+DISCOVERY_BATCH = 32
+
+# Largest discovery datagram accepted, anything longer is cut short and
+# fails to parse
+DISCOVERY_MAX_SIZE = 1024
+
+BROADCAST_ADDR = ('255.255.255.255', DISCOVERY_PORT)
+
+
+def _enable_keepalive(sock: socket.socket):
+    """Have the kernel probe an idle connection so a dead peer is noticed"""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # Linux names; other platforms keep their system defaults
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 5)
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 2)
+    if hasattr(socket, 'TCP_KEEPCNT'):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+
 
 class NetworkPeer:
     def __init__(self, host: str, port: int, machine_id: str):
@@ -18,12 +53,34 @@ class NetworkPeer:
         self.last_seen = time.time()
         self.population_count = 0
         self.available_food = 0
+        # Protocol version the peer last advertised, and what it allows
+        self.protocol_version: Optional[str] = None
+        # Whether the peer's discovery messages may be sent packed
+        self.packed_discovery = False
+        # Whether the peer answers BULK_STATUS requests
+        self.bulk_status = False
+        # Last detailed status reply and when (monotonic) it was current
+        self.detailed_status: Optional[Dict[str, Any]] = None
+        self.status_updated = 0.0
 
     def update_status(self, population: int, food: int):
         self.population_count = population
         self.available_food = food
         self.last_seen = time.time()
 
+    def record_detailed_status(self, status: Dict[str, Any], age: float = 0.0):
+        """Remember a detailed status that was current age seconds ago"""
+        updated = time.monotonic() - age
+        if updated > self.status_updated:
+            self.detailed_status = status
+            self.status_updated = updated
+
+    def status_age(self) -> float:
+        """Seconds since the cached detailed status was current"""
+        if self.detailed_status is None:
+            return float('inf')
+        return time.monotonic() - self.status_updated
+
     def is_alive(self) -> bool:
         return time.time() - self.last_seen < PEER_TIMEOUT
 
@@ -40,29 +97,81 @@ class NetworkPeer:
 class NetworkManager:
     def __init__(self, simulation_engine=None):
         self.simulation = simulation_engine
-        self.machine_id = socket.gethostname()
+        self.machine_id = socket.gethostname()[:MAX_MACHINE_ID_LENGTH]
+
+        # Message ids are a per-run prefix plus a counter, unique without
+        # drawing from urandom for every message
+        self._message_prefix = hashlib.blake2b(
+            f"{self.machine_id}:{time.time_ns()}".encode(), digest_size=6).hexdigest()
+        self._message_counter = itertools.count(1)
         self.peers: Dict[str, NetworkPeer] = {}
         self.running = False
 
+        # (-attractiveness, machine_id, last_seen) per status update. Entries
+        # whose last_seen no longer matches the peer are stale and skipped
+        self._peer_heap: List[Tuple[float, str, float]] = []
+        # (expires_at, machine_id, last_seen) per status update, same staleness
+        # rule, so the heartbeat sweep only looks at peers that may have expired
+        self._expiry_heap: List[Tuple[float, str, float]] = []
+        self._peer_heap_lock = threading.Lock()
+
         # Network threads
         self._discovery_thread = None
         self._heartbeat_thread = None
         self._comm_server_thread = None
         self._migration_thread = None
 
+        # Workers serving inbound peer messages, and every open inbound
+        # socket. Idle ones wait in the server loop's selector, a worker only
+        # takes a connection once a message is waiting on it
+        self._comm_pool: Optional[ThreadPoolExecutor] = None
+        self._comm_clients = set()
+        self._comm_clients_lock = threading.Lock()
+        # Connections a worker has answered on, handed back to the server
+        # loop, which is woken through the socketpair's write end
+        self._comm_returns: queue.SimpleQueue = queue.SimpleQueue()
+        self._comm_waker: Optional[socket.socket] = None
+
         # Sockets
         self._discovery_socket = None
         self._comm_socket = None
 
+        # Migration log, opened on the first event and kept open
+        self._migration_log = None
+
+        # Constant part of every discovery payload; copied and filled in per
+        # message since replies are built on several threads at once
+        self._discovery_template = {
+            'comm_port': COMMUNICATION_PORT,
+            'protocol_version': PROTOCOL_VERSION
+        }
+
+        # Idle outbound connections per (host, port), with when they were last used
+        self._peer_conns: Dict[Tuple[str, int], List[Tuple[socket.socket, float]]] = {}
+        self._peer_conns_lock = threading.Lock()
+
+        # Our own address, used to drop our discovery broadcasts as they echo back
+        self._local_ip = "127.0.0.1"
+
         # Message handlers
         self.message_handlers = {
             MessageType.DISCOVERY: self._handle_discovery,
             MessageType.DISCOVERY_RESPONSE: self._handle_discovery_response,
             MessageType.HEARTBEAT: self._handle_heartbeat,
+            MessageType.BULK_STATUS: self._handle_bulk_status,
             MessageType.CREATURE_MIGRATION: self._handle_creature_migration,
             MessageType.CREATURE_MIGRATION_ACK: self._handle_migration_ack,
         }
 
+        # ALLOWED_NETWORKS parsed once; IPv4 ranges as (network, netmask)
+        # integers so the check on every packet is plain bit arithmetic
+        allowed = [ipaddress.ip_network(network) for network in ALLOWED_NETWORKS]
+        self._allowed_v4 = tuple(
+            (int(network.network_address), int(network.netmask))
+            for network in allowed if network.version == 4)
+        self._allowed_other = tuple(
+            network for network in allowed if network.version != 4)
+
         self.logger = logging.getLogger(__name__)
 
     def start(self):
@@ -72,6 +181,10 @@ class NetworkManager:
 
         self.running = True
 
+        # Resolved once here and again with each discovery broadcast rather
+        # than per received datagram
+        self._local_ip = self._get_local_ip()
+
         # Start discovery service
         self._start_discovery()
 
@@ -84,8 +197,7 @@ class NetworkManager:
         # Start migration manager
         self._start_migration_manager()
 
-        self.logger.info(f"Network services started for machine {
-                         self.machine_id}")
+        self.logger.info("Network services started for machine %s", self.machine_id)
 
     def stop(self):
         """Stop all network services"""
@@ -95,6 +207,11 @@ class NetworkManager:
             self._discovery_socket.close()
         if self._comm_socket:
             self._comm_socket.close()
+        self._close_peer_connections()
+        self._close_comm_clients()
+        if self._migration_log:
+            self._migration_log.close()
+            self._migration_log = None
 
         # Wait for threads to finish
         for thread in [self._discovery_thread, self._heartbeat_thread,
@@ -107,13 +224,19 @@ class NetworkManager:
     def _is_safe_network(self, ip: str) -> bool:
         """Check if IP is in allowed network ranges"""
         try:
-            ip_addr = ipaddress.ip_address(ip)
-            for network in ALLOWED_NETWORKS:
-                if ip_addr in ipaddress.ip_network(network):
-                    return True
-            return False
-        except ValueError:
-            return False
+            (address,) = _IPV4.unpack(socket.inet_pton(socket.AF_INET, ip))
+        except OSError:
+            # Not dotted-quad IPv4, take the slow path for anything else
+            try:
+                ip_addr = ipaddress.ip_address(ip)
+            except ValueError:
+                return False
+            return any(ip_addr in network for network in self._allowed_other)
+
+        for network, netmask in self._allowed_v4:
+            if address & netmask == network:
+                return True
+        return False
 
     def _start_discovery(self):
         """Start UDP discovery service"""
@@ -132,30 +255,44 @@ class NetworkManager:
             self._discovery_socket.setsockopt(
                 socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self._discovery_socket.bind(('', DISCOVERY_PORT))
-            self._discovery_socket.settimeout(1.0)
+            # Non-blocking, waited on with select: one wakeup then drain every
+            # queued datagram, rather than a poll() ahead of each recvfrom as
+            # a socket timeout would do
+            self._discovery_socket.setblocking(False)
+
+            # Datagrams are received into one reused buffer and parsed from
+            # a view of it, nothing is allocated per packet until decoding
+            buffer = bytearray(DISCOVERY_MAX_SIZE)
+            view = memoryview(buffer)
 
             last_broadcast = 0
 
             while self.running:
                 # Send discovery broadcast
                 if time.time() - last_broadcast > DISCOVERY_INTERVAL:
+                    self._local_ip = self._get_local_ip()
                     self._send_discovery_broadcast()
                     last_broadcast = time.time()
 
                 # Listen for discovery messages
                 try:
-                    data, addr = self._discovery_socket.recvfrom(1024)
-                    if self._is_safe_network(addr[0]) and addr[0] != self._get_local_ip():
-                        self._handle_discovery_message(
-                            data.decode('utf-8'), addr)
-                except socket.timeout:
-                    continue
+                    readable, _, _ = select.select(
+                        [self._discovery_socket], [], [], 1.0)
+                    if not readable:
+                        continue
+                    for _ in range(DISCOVERY_BATCH):
+                        try:
+                            size, addr = self._discovery_socket.recvfrom_into(buffer)
+                        except BlockingIOError:
+                            break
+                        if self._is_safe_network(addr[0]) and addr[0] != self._local_ip:
+                            self._handle_discovery_message(view[:size], addr)
                 except Exception as e:
                     if self.running:
-                        self.logger.error(f"Discovery error: {e}")
+                        self.logger.error("Discovery error: %s", e)
 
         except Exception as e:
-            self.logger.error(f"Discovery service error: {e}")
+            self.logger.error("Discovery service error: %s", e)
 
     def _send_discovery_broadcast(self):
         """Send discovery broadcast message"""
@@ -164,26 +301,38 @@ class NetworkManager:
             sender_id=self.machine_id,
             recipient_id=None,
             timestamp=time.time(),
-            payload={
-                'comm_port': COMMUNICATION_PORT,
-                'population': len(self.simulation.creatures) if self.simulation else 0,
-                'food': self.simulation.world_state.food if self.simulation else 0,
-                'protocol_version': PROTOCOL_VERSION
-            },
-            message_id=str(uuid.uuid4())
+            payload=self._discovery_payload(),
+            message_id=self.next_message_id()
         )
 
+        # Packed only once every known peer can read it, a peer on an older
+        # version still answers our JSON replies to its own broadcasts
+        peers = list(self.peers.values())
+        if peers and all(peer.packed_discovery for peer in peers):
+            data = pack_discovery(message)
+        else:
+            data = message.to_bytes()
+
         try:
-            broadcast_addr = ('255.255.255.255', DISCOVERY_PORT)
-            self._discovery_socket.sendto(
-                message.to_json().encode('utf-8'), broadcast_addr)
+            self._discovery_socket.sendto(data, BROADCAST_ADDR)
         except Exception as e:
-            self.logger.error(f"Failed to send discovery broadcast: {e}")
-
-    def _handle_discovery_message(self, data: str, addr):
+            self.logger.error("Failed to send discovery broadcast: %s", e)
+
+    def _discovery_payload(self) -> Dict[str, Any]:
+        """Payload of a discovery broadcast or response"""
+        payload = self._discovery_template.copy()
+        if self.simulation:
+            payload['population'] = len(self.simulation.creatures)
+            payload['food'] = self.simulation.world_state.food
+        else:
+            payload['population'] = 0
+            payload['food'] = 0
+        return payload
+
+    def _handle_discovery_message(self, data: memoryview, addr):
         """Handle incoming discovery message"""
         try:
-            message = NetworkMessage.from_json(data)
+            message = unpack_discovery(data)
 
             if message.message_type == MessageType.DISCOVERY:
                 # Respond to discovery
@@ -193,7 +342,7 @@ class NetworkManager:
             self._update_peer_info(message, addr[0])
 
         except Exception as e:
-            self.logger.error(f"Error handling discovery message: {e}")
+            self.logger.error("Error handling discovery message: %s", e)
 
     def _send_discovery_response(self, target_ip: str, original_message: NetworkMessage):
         """Send discovery response"""
@@ -202,26 +351,37 @@ class NetworkManager:
             sender_id=self.machine_id,
             recipient_id=original_message.sender_id,
             timestamp=time.time(),
-            payload={
-                'comm_port': COMMUNICATION_PORT,
-                'population': len(self.simulation.creatures) if self.simulation else 0,
-                'food': self.simulation.world_state.food if self.simulation else 0,
-                'protocol_version': PROTOCOL_VERSION
-            },
-            message_id=str(uuid.uuid4())
+            payload=self._discovery_payload(),
+            message_id=self.next_message_id()
         )
 
+        if supports_packed_discovery(original_message.payload.get('protocol_version')):
+            data = pack_discovery(response)
+        else:
+            data = response.to_bytes()
+
         try:
             self._discovery_socket.sendto(
-                response.to_json().encode('utf-8'),
+                data,
                 (target_ip, DISCOVERY_PORT)
             )
         except Exception as e:
-            self.logger.error(f"Failed to send discovery response: {e}")
+            self.logger.error("Failed to send discovery response: %s", e)
 
     def _update_peer_info(self, message: NetworkMessage, ip: str):
         """Update peer information"""
+        if len(message.sender_id) > MAX_MACHINE_ID_LENGTH:
+            return  # Not a machine id we would hand out, don't track it
         if message.sender_id != self.machine_id:  # Don't add ourselves
+            protocol_version = message.payload.get('protocol_version')
+            if not supports_framing(protocol_version):
+                # Can't exchange messages with it, so don't offer it as a
+                # migration target or query it for status
+                if self.peers.pop(message.sender_id, None):
+                    self.logger.info("Dropping peer %s, protocol %s is too old",
+                                     message.sender_id, protocol_version)
+                return
+
             comm_port = message.payload.get('comm_port', COMMUNICATION_PORT)
 
             if message.sender_id not in self.peers:
@@ -230,18 +390,61 @@ class NetworkManager:
                     port=comm_port,
                     machine_id=message.sender_id
                 )
-                self.logger.info(f"Discovered new peer: {
-                                 message.sender_id} at {ip}")
+                self.logger.info("Discovered new peer: %s at %s",
+                                 message.sender_id, ip)
 
             # Update peer status
             peer = self.peers[message.sender_id]
+            peer.protocol_version = protocol_version
+            peer.packed_discovery = supports_packed_discovery(protocol_version)
+            peer.bulk_status = supports_bulk_status(protocol_version)
             peer.update_status(
                 message.payload.get('population', 0),
                 message.payload.get('food', 0)
             )
+            self._index_peer(peer)
+
+    def _index_peer(self, peer: NetworkPeer):
+        """Record the peer's current attractiveness and expiry in the peer heaps"""
+        with self._peer_heap_lock:
+            heapq.heappush(self._peer_heap, (
+                -peer.migration_attractiveness(), peer.machine_id, peer.last_seen))
+            heapq.heappush(self._expiry_heap, (
+                peer.last_seen + PEER_TIMEOUT, peer.machine_id, peer.last_seen))
+
+            # Stale entries only leave when they reach the top, rebuild once
+            # they clearly outnumber the live ones
+            if len(self._peer_heap) > 2 * len(self.peers) + 16:
+                peers = list(self.peers.values())
+                self._peer_heap = [
+                    (-p.migration_attractiveness(), p.machine_id, p.last_seen)
+                    for p in peers
+                ]
+                heapq.heapify(self._peer_heap)
+                self._expiry_heap = [
+                    (p.last_seen + PEER_TIMEOUT, p.machine_id, p.last_seen)
+                    for p in peers
+                ]
+                heapq.heapify(self._expiry_heap)
+
+    def _expired_peers(self) -> List[str]:
+        """Pop expiry entries that are due and return the peers that really expired"""
+        now = time.time()
+        expired = []
+        with self._peer_heap_lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                _, machine_id, last_seen = heapq.heappop(heap)
+                # A peer heard from since has a newer entry further down
+                peer = self.peers.get(machine_id)
+                if peer is not None and peer.last_seen == last_seen:
+                    expired.append(machine_id)
+        return expired
 
     def _start_communication_server(self):
         """Start TCP communication server"""
+        self._comm_pool = ThreadPoolExecutor(
+            max_workers=PEER_MAX_CONNECTIONS, thread_name_prefix='thronglet-comm')
         self._comm_server_thread = threading.Thread(
             target=self._communication_server_loop)
         self._comm_server_thread.daemon = True
@@ -249,6 +452,10 @@ class NetworkManager:
 
     def _communication_server_loop(self):
         """TCP server for reliable communication"""
+        selector = selectors.DefaultSelector()
+        # Idle inbound connections and when (monotonic) they went idle
+        idle: Dict[socket.socket, float] = {}
+        wake_socket = None
         try:
             self._comm_socket = socket.socket(
                 socket.AF_INET, socket.SOCK_STREAM)
@@ -256,45 +463,155 @@ class NetworkManager:
                 socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self._comm_socket.bind(('', COMMUNICATION_PORT))
             self._comm_socket.listen(5)
-            self._comm_socket.settimeout(1.0)
+            self._comm_socket.setblocking(False)
+            selector.register(self._comm_socket, selectors.EVENT_READ)
+
+            wake_socket, self._comm_waker = socket.socketpair()
+            wake_socket.setblocking(False)
+            selector.register(wake_socket, selectors.EVENT_READ)
 
             while self.running:
                 try:
-                    client_socket, addr = self._comm_socket.accept()
-                    if self._is_safe_network(addr[0]):
-                        threading.Thread(
-                            target=self._handle_communication_client,
-                            args=(client_socket,),
-                            daemon=True
-                        ).start()
-                    else:
-                        client_socket.close()
-                except socket.timeout:
-                    continue
+                    for key, _ in selector.select(timeout=1.0):
+                        sock = key.fileobj
+                        if sock is self._comm_socket:
+                            self._accept_comm_client(selector, idle)
+                        elif sock is wake_socket:
+                            self._park_returned_clients(wake_socket, selector, idle)
+                        else:
+                            # A message is waiting, hand the connection over
+                            selector.unregister(sock)
+                            del idle[sock]
+                            self._dispatch_comm_client(sock)
+
+                    # Peers pool their connections, give them longer than
+                    # their own idle eviction before dropping from this side
+                    cutoff = time.monotonic() - 2 * PEER_CONN_IDLE_TIMEOUT
+                    for sock in [sock for sock, since in idle.items() if since < cutoff]:
+                        selector.unregister(sock)
+                        del idle[sock]
+                        self._drop_comm_client(sock)
                 except Exception as e:
                     if self.running:
-                        self.logger.error(f"Communication server error: {e}")
+                        self.logger.error("Communication server error: %s", e)
 
         except Exception as e:
-            self.logger.error(f"Communication server setup error: {e}")
+            self.logger.error("Communication server setup error: %s", e)
+        finally:
+            for sock in idle:
+                self._drop_comm_client(sock)
+            selector.close()
+            if wake_socket:
+                wake_socket.close()
+
+    def _accept_comm_client(self, selector: selectors.BaseSelector,
+                            idle: Dict[socket.socket, float]):
+        """Accept a pending peer connection and wait for its first message"""
+        try:
+            client_socket, addr = self._comm_socket.accept()
+        except BlockingIOError:
+            return
+        if not self._is_safe_network(addr[0]):
+            client_socket.close()
+            return
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        _enable_keepalive(client_socket)
+        with self._comm_clients_lock:
+            self._comm_clients.add(client_socket)
+        selector.register(client_socket, selectors.EVENT_READ)
+        idle[client_socket] = time.monotonic()
+
+    def _dispatch_comm_client(self, client_socket: socket.socket):
+        """Give a connection with a waiting message to a worker"""
+        pool = self._comm_pool
+        try:
+            if pool is None:
+                raise RuntimeError("communication pool is shut down")
+            pool.submit(self._handle_communication_client, client_socket)
+        except RuntimeError:
+            self._drop_comm_client(client_socket)  # Stopping
+
+    def _park_returned_clients(self, wake_socket: socket.socket,
+                               selector: selectors.BaseSelector,
+                               idle: Dict[socket.socket, float]):
+        """Wait for the next message on connections the workers handed back"""
+        try:
+            while wake_socket.recv(512):
+                pass
+        except BlockingIOError:
+            pass
+        now = time.monotonic()
+        while True:
+            try:
+                client_socket = self._comm_returns.get_nowait()
+            except queue.Empty:
+                break
+            selector.register(client_socket, selectors.EVENT_READ)
+            idle[client_socket] = now
 
     def _handle_communication_client(self, client_socket):
-        """Handle TCP communication client"""
+        """Answer one message on a connection, then hand it back to wait idle"""
+        keep = False
         try:
-            # Receive message
-            data = client_socket.recv(MAX_MESSAGE_SIZE).decode('utf-8')
-            message = NetworkMessage.from_json(data)
+            # The message is already arriving, bound how long the rest may take
+            client_socket.settimeout(MESSAGE_TIMEOUT)
+            try:
+                data = recv_frame(client_socket, MAX_MESSAGE_SIZE)
+            except (ConnectionError, socket.timeout):
+                return  # Peer closed the connection or stalled mid-message
+            message = NetworkMessage.from_bytes(data)
 
-            # Handle message
+            # Handle message, a message without a reply ends the exchange
+            response = None
             if message.message_type in self.message_handlers:
                 response = self.message_handlers[message.message_type](message)
-                if response:
-                    client_socket.send(response.to_json().encode('utf-8'))
+            if not response:
+                return
+            send_frame(client_socket, response.to_bytes())
+            keep = self.running
 
         except Exception as e:
-            self.logger.error(f"Error handling communication client: {e}")
+            self.logger.error("Error handling communication client: %s", e)
         finally:
-            client_socket.close()
+            waker = self._comm_waker
+            if keep and waker:
+                self._comm_returns.put(client_socket)
+                try:
+                    waker.send(b'\0')
+                except OSError:
+                    pass  # Server loop is gone, stop() closes the socket
+            else:
+                self._drop_comm_client(client_socket)
+
+    def _drop_comm_client(self, client_socket: socket.socket):
+        """Close an inbound peer connection"""
+        with self._comm_clients_lock:
+            self._comm_clients.discard(client_socket)
+        client_socket.close()
+
+    def _close_comm_clients(self):
+        """Drop inbound peer connections and stop the workers serving them"""
+        with self._comm_clients_lock:
+            clients = list(self._comm_clients)
+        for client_socket in clients:
+            try:
+                # Wakes a worker blocked in recv so it can exit
+                client_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._comm_pool:
+            # Queued connections still run, see their socket shut and close it
+            self._comm_pool.shutdown(wait=False)
+            self._comm_pool = None
+        if self._comm_waker:
+            self._comm_waker.close()
+            self._comm_waker = None
+        # Handed back after the server loop stopped parking them
+        while True:
+            try:
+                self._drop_comm_client(self._comm_returns.get_nowait())
+            except queue.Empty:
+                break
 
     def _start_heartbeat(self):
         """Start heartbeat service"""
@@ -306,14 +623,9 @@ class NetworkManager:
         """Send periodic heartbeats and clean up dead peers"""
         while self.running:
             # Clean up dead peers
-            dead_peers = [
-                peer_id for peer_id, peer in self.peers.items()
-                if not peer.is_alive()
-            ]
-
-            for peer_id in dead_peers:
-                self.logger.info(f"Removing dead peer: {peer_id}")
-                del self.peers[peer_id]
+            for peer_id in self._expired_peers():
+                self.logger.info("Removing dead peer: %s", peer_id)
+                self.peers.pop(peer_id, None)
 
             time.sleep(HEARTBEAT_INTERVAL)
 
@@ -330,7 +642,7 @@ class NetworkManager:
                 if self.simulation and self.peers:
                     self._attempt_migrations()
             except Exception as e:
-                self.logger.error(f"Migration error: {e}")
+                self.logger.error("Migration error: %s", e)
 
             time.sleep(MIGRATION_INTERVAL)
 
@@ -366,25 +678,26 @@ class NetworkManager:
         # Migrate creatures
         for creature in migrants:
             if self._migrate_creature(creature, best_peer):
-                self.logger.info(f"Migrated {creature.name} to {
-                                 best_peer.machine_id}")
+                self.logger.info("Migrated %s to %s",
+                                 creature.name, best_peer.machine_id)
 
     def _find_best_migration_target(self) -> Optional[NetworkPeer]:
         """Find the best peer for migration"""
         if not self.peers:
             return None
 
-        # Sort peers by attractiveness
-        sorted_peers = sorted(
-            self.peers.values(),
-            key=lambda p: p.migration_attractiveness(),
-            reverse=True
-        )
-
-        # Return the most attractive peer that's alive
-        for peer in sorted_peers:
-            if peer.is_alive():
-                return peer
+        # Return the most attractive peer that's alive, dropping entries for
+        # peers that were updated since, removed, or have gone quiet
+        with self._peer_heap_lock:
+            heap = self._peer_heap
+            while heap:
+                neg_attractiveness, machine_id, last_seen = heap[0]
+                peer = self.peers.get(machine_id)
+                if (peer is not None and peer.last_seen == last_seen
+                        and peer.is_alive()
+                        and supports_framing(peer.protocol_version)):
+                    return peer
+                heapq.heappop(heap)
         return None
 
     def _migrate_creature(self, creature, target_peer: NetworkPeer) -> bool:
@@ -401,7 +714,7 @@ class NetworkManager:
                 recipient_id=target_peer.machine_id,
                 timestamp=time.time(),
                 payload=migration_data.to_dict(),
-                message_id=str(uuid.uuid4())
+                message_id=self.next_message_id()
             )
 
             # Send migration request
@@ -423,55 +736,108 @@ class NetworkManager:
                     self.simulation.remove_creature(creature.id)
                     return True
                 else:
-                    self.logger.warning(f"Migration rejected: {
-                                        response.payload.get('reason', 'unknown')}")
+                    self.logger.warning("Migration rejected: %s",
+                                        response.payload.get('reason', 'unknown'))
 
             return False
 
         except Exception as e:
-            self.logger.error(f"Migration failed: {e}")
+            self.logger.error("Migration failed: %s", e)
             return False
 
     def _log_migration_event(self, event: Dict[str, Any]):
         """Log migration event to file"""
         try:
-            from pathlib import Path
-            import json
+            if self._migration_log is None:
+                # Try to use system directory first, fall back to local
+                log_dir = Path("/opt/thronglet/data")
+                if not log_dir.exists():
+                    log_dir = Path("data")
+                log_dir.mkdir(parents=True, exist_ok=True)
 
-            # Try to use system directory first, fall back to local
-            log_dir = Path("/opt/thronglet/data")
-            if not log_dir.exists():
-                log_dir = Path("data")
-            log_dir.mkdir(parents=True, exist_ok=True)
+                # Unbuffered so each event is one write(2) readers see at once
+                self._migration_log = open(
+                    log_dir / "migrations.log", 'ab', buffering=0)
 
-            migration_log = log_dir / "migrations.log"
-
-            with open(migration_log, 'a') as f:
-                f.write(f"{time.time()}: {json.dumps(event)}\n")
+            self._migration_log.write(
+                f"{time.time()}: ".encode() + _json.dumps(event) + b"\n")
 
         except Exception as e:
-            self.logger.error(f"Failed to log migration event: {e}")
+            self.logger.error("Failed to log migration event: %s", e)
 
     def _send_reliable_message(self, peer: NetworkPeer, message: NetworkMessage) -> Optional[NetworkMessage]:
         """Send message via TCP and wait for response"""
+        address = (peer.host, peer.port)
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(MESSAGE_TIMEOUT)
-            sock.connect((peer.host, peer.port))
-
-            # Send message
-            sock.send(message.to_json().encode('utf-8'))
+            while True:
+                sock, reused = self._acquire_peer_connection(address)
+                try:
+                    # Send message
+                    send_frame(sock, message.to_bytes())
+
+                    # Wait for response
+                    response_data = recv_frame(sock, MAX_MESSAGE_SIZE)
+                    response = NetworkMessage.from_bytes(response_data)
+                except TimeoutError:
+                    # The peer may still act on it, so don't send it again
+                    sock.close()
+                    raise
+                except ConnectionError:
+                    sock.close()
+                    if reused:
+                        continue  # Peer dropped the idle connection, redial
+                    raise
+                except Exception:
+                    sock.close()
+                    raise
+
+                self._release_peer_connection(address, sock)
+                return response
 
-            # Wait for response
-            response_data = sock.recv(MAX_MESSAGE_SIZE).decode('utf-8')
-            response = NetworkMessage.from_json(response_data)
+        except Exception as e:
+            self.logger.error("Failed to send reliable message: %s", e)
+            return None
 
+    def _acquire_peer_connection(self, address: Tuple[str, int]) -> Tuple[socket.socket, bool]:
+        """Take an idle pooled connection to address or dial a new one"""
+        now = time.monotonic()
+        with self._peer_conns_lock:
+            idle = self._peer_conns.get(address)
+            while idle:
+                sock, last_used = idle.pop()
+                if now - last_used < PEER_CONN_IDLE_TIMEOUT:
+                    return sock, True
+                sock.close()
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            # Small request/response exchange, don't let Nagle hold it back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            _enable_keepalive(sock)
+            sock.settimeout(MESSAGE_TIMEOUT)
+            sock.connect(address)
+        except OSError:
             sock.close()
-            return response
+            raise
+        return sock, False
 
-        except Exception as e:
-            self.logger.error(f"Failed to send reliable message: {e}")
-            return None
+    def _release_peer_connection(self, address: Tuple[str, int], sock: socket.socket):
+        """Return a healthy connection to the pool for the next message"""
+        if not self.running:
+            sock.close()
+            return
+        with self._peer_conns_lock:
+            self._peer_conns.setdefault(address, []).append(
+                (sock, time.monotonic()))
+
+    def _close_peer_connections(self):
+        """Close every pooled outbound connection"""
+        with self._peer_conns_lock:
+            pooled = self._peer_conns
+            self._peer_conns = {}
+        for idle in pooled.values():
+            for sock, last_used in idle:
+                sock.close()
 
     def _handle_discovery(self, message: NetworkMessage) -> Optional[NetworkMessage]:
         """Handle discovery message"""
@@ -485,19 +851,9 @@ class NetworkManager:
 
     def _handle_heartbeat(self, message: NetworkMessage) -> NetworkMessage:
         """Handle heartbeat message with optional detailed status request"""
-        payload = {
-            'population': len(self.simulation.creatures) if self.simulation else 0,
-            'food': self.simulation.world_state.food if self.simulation else 0
-        }
-
         # Check if detailed status is requested
-        if message.payload.get('request_detailed_status'):
-            payload.update({
-                'max_population': self.simulation.world_state.max_population if self.simulation else 50,
-                'max_food': self.simulation.world_state.max_food if self.simulation else 100,
-                'temperature': self.simulation.world_state.temperature if self.simulation else 20,
-                'state_counts': self._get_local_state_counts() if self.simulation else {}
-            })
+        payload = self._status_payload(
+            bool(message.payload.get('request_detailed_status')))
 
         return NetworkMessage(
             message_type=MessageType.HEARTBEAT,
@@ -505,7 +861,54 @@ class NetworkManager:
             recipient_id=message.sender_id,
             timestamp=time.time(),
             payload=payload,
-            message_id=str(uuid.uuid4())
+            message_id=self.next_message_id()
+        )
+
+    def _status_payload(self, detailed: bool) -> Dict[str, Any]:
+        """Heartbeat payload, with the detailed status fields when asked for"""
+        if not self.simulation:
+            payload = {'population': 0, 'food': 0}
+            if detailed:
+                payload.update(max_population=50, max_food=100,
+                               temperature=20, state_counts={})
+            return payload
+
+        # One dict built in place from a single world state lookup
+        world = self.simulation.world_state
+        if not detailed:
+            return {
+                'population': len(self.simulation.creatures),
+                'food': world.food
+            }
+        return {
+            'population': len(self.simulation.creatures),
+            'food': world.food,
+            'max_population': world.max_population,
+            'max_food': world.max_food,
+            'temperature': world.temperature,
+            'state_counts': self._get_local_state_counts()
+        }
+
+    def _handle_bulk_status(self, message: NetworkMessage) -> NetworkMessage:
+        """Reply with our own detailed status plus every fresh one we know of"""
+        own_status = self._status_payload(True)
+
+        # Ages rather than timestamps, so clock skew between machines
+        # doesn't matter
+        statuses = {self.machine_id: {'status': own_status, 'age': 0.0}}
+        for peer in self.get_connected_peers():
+            age = peer.status_age()
+            if age < PEER_STATUS_MAX_AGE and peer.machine_id != message.sender_id:
+                statuses[peer.machine_id] = {
+                    'status': peer.detailed_status, 'age': age}
+
+        return NetworkMessage(
+            message_type=MessageType.BULK_STATUS,
+            sender_id=self.machine_id,
+            recipient_id=message.sender_id,
+            timestamp=time.time(),
+            payload={'statuses': statuses},
+            message_id=self.next_message_id()
         )
 
     def _get_local_state_counts(self) -> Dict[str, int]:
@@ -513,11 +916,8 @@ class NetworkManager:
         if not self.simulation:
             return {}
 
-        state_counts = {}
-        for creature in self.simulation.creatures.values():
-            state = creature.state.value
-            state_counts[state] = state_counts.get(state, 0) + 1
-        return state_counts
+        # Maintained by the engine as creatures change state
+        return self.simulation.get_state_counts()
 
     def _handle_creature_migration(self, message: NetworkMessage) -> NetworkMessage:
         """Handle incoming creature migration"""
@@ -531,24 +931,15 @@ class NetworkManager:
             if not self.simulation.world_state.can_support_creature():
                 return self._create_migration_response(False, "Population limit reached")
 
-            # Create creature from migration data
-            from ..domain.creature import Creature
-            migrated_creature = Creature.from_migration_data(
-                migration_data.creature_data,
-                self.machine_id
-            )
-
-            # Add to simulation
-            self.simulation.creatures[migrated_creature.id] = migrated_creature
-            self.simulation.world_state.population_count += 1
-
-            self.logger.info(f"Accepted migrated creature: {
-                             migrated_creature.name} from {message.sender_id}")
+            # Add to simulation, which keeps its creature indexes in step
+            if not self.simulation.accept_migrated_creature(
+                    migration_data.creature_data, message.sender_id):
+                return self._create_migration_response(False, "Could not add creature")
 
             return self._create_migration_response(True, "Migration accepted")
 
         except Exception as e:
-            self.logger.error(f"Error handling creature migration: {e}")
+            self.logger.error("Error handling creature migration: %s", e)
             return self._create_migration_response(False, f"Error: {str(e)}")
 
     def _create_migration_response(self, accepted: bool, reason: str) -> NetworkMessage:
@@ -562,7 +953,7 @@ class NetworkManager:
                 'accepted': accepted,
                 'reason': reason
             },
-            message_id=str(uuid.uuid4())
+            message_id=self.next_message_id()
         )
 
     def _handle_migration_ack(self, message: NetworkMessage) -> Optional[NetworkMessage]:
@@ -582,6 +973,10 @@ class NetworkManager:
         except:
             return "127.0.0.1"
 
+    def next_message_id(self) -> str:
+        """Return an id for an outgoing message"""
+        return f"{self._message_prefix}-{next(self._message_counter)}"
+
     def get_connected_peers(self) -> List[NetworkPeer]:
         """Get list of active network peers"""
         return [peer for peer in self.peers.values() if peer.is_alive()]
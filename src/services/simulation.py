@@ -1,25 +1,56 @@
 import time
+import socket
 import threading
 import uuid
 import random
-from typing import List, Dict, Any
+import queue
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 import logging
 from ..domain.creature import Creature, CreatureState, WorldState
 from ..domain.behavior import BehaviorFSM, process_pending_offspring, get_creature_statistics
 from ..infrastructure.repository import FileRepository
+from ..infrastructure.network_protocol import MAX_MACHINE_ID_LENGTH
+
+# Longest the simulation thread waits before checking whether it should stop
+LOOP_INTERVAL = 0.1
+
+# Temperature and social effects on happiness are applied every
+# ENVIRONMENT_PERIOD ticks instead of every tick, scaled up by the same
+# factor so the long-run drift is unchanged: temperature on ticks where
+# tick % ENVIRONMENT_PERIOD == 0, social on those where it is half way
+ENVIRONMENT_PERIOD = 4
 
 
 class SimulationEngine:
-    def __init__(self, tick_rate: float = 5.0):
+    def __init__(self, tick_rate: float = 5.0, seed: Optional[int] = None):
         self.tick_rate = tick_rate
+        # Every random draw of the simulation comes from here, seed it to
+        # replay a run
+        self.rng = random.Random(seed)
+        self._random = self.rng.random
         self.running = False
         self.creatures: Dict[str, Creature] = {}
+        # name -> {id: creature}; names are not unique, first added wins lookups
+        self._by_name: Dict[str, Dict[str, Creature]] = {}
+        # Creatures per state, recounted during each tick and adjusted
+        # as creatures come and go in between
+        self._state_counts: Counter = Counter()
         self.world_state = WorldState()
-        self.behavior_fsm = BehaviorFSM()
+        self.behavior_fsm = BehaviorFSM(self.rng)
         self.repository = FileRepository()
         self.logger = logging.getLogger(__name__)
         self._tick_thread = None
         self._tick_count = 0
+        # (future, func, args) from other threads, run between ticks
+        self._commands: queue.SimpleQueue = queue.SimpleQueue()
+        # Held while enqueueing and while stopping, so nothing is queued
+        # after stop() has started its final drain
+        self._commands_lock = threading.Lock()
+        # Periodic saves are encoded on the tick and written by this worker
+        self._save_executor: Optional[ThreadPoolExecutor] = None
+        self._save_future: Optional[Future] = None
 
         # Statistics
         self._last_stats_update = time.time()
@@ -29,6 +60,9 @@ class SimulationEngine:
         # Initialize network manager as None
         self.network_manager = None
 
+        # Resolved once; the hostname is stamped on every creature created here
+        self._machine_id = socket.gethostname()[:MAX_MACHINE_ID_LENGTH]
+
     def start(self):
         """Start the simulation loop"""
         if self.running:
@@ -36,6 +70,8 @@ class SimulationEngine:
 
         self.running = True
         self.load_state()
+        self._save_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='thronglet-save')
         self._tick_thread = threading.Thread(target=self._simulation_loop)
         self._tick_thread.daemon = True
         self._tick_thread.start()
@@ -43,21 +79,69 @@ class SimulationEngine:
 
     def stop(self):
         """Stop the simulation loop"""
-        self.running = False
+        with self._commands_lock:
+            self.running = False
         if self._tick_thread:
             self._tick_thread.join()
+        # Nothing drains the queue any more, finish what was left in it
+        while not self._commands.empty():
+            self._run_command(self._commands.get())
+        # Let a periodic save in flight land before the final one
+        if self._save_executor:
+            self._save_executor.shutdown(wait=True)
+            self._save_executor = None
         self.save_state()
         self.logger.info("Simulation stopped")
 
     def _simulation_loop(self):
-        """Main simulation tick loop"""
+        """Main simulation loop: a tick every tick_rate, commands as they arrive"""
+        next_tick = time.monotonic()
         while self.running:
             try:
+                remaining = next_tick - time.monotonic()
+                if remaining > 0:
+                    try:
+                        command = self._commands.get(
+                            timeout=min(remaining, LOOP_INTERVAL))
+                    except queue.Empty:
+                        continue
+                    self._run_command(command)
+                    continue
+
+                # Ticks stay on a fixed step; after a stall longer than a
+                # tick, carry on from now rather than running a burst
+                next_tick += self.tick_rate
+                if next_tick <= time.monotonic():
+                    next_tick = time.monotonic() + self.tick_rate
                 self.tick()
-                time.sleep(self.tick_rate)
             except Exception as e:
                 self.logger.error(f"Simulation tick error: {e}")
 
+    def _run_command(self, command):
+        """Run one queued command and hand its outcome to the waiting caller"""
+        future, func, args = command
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except Exception as e:
+            future.set_exception(e)
+
+    def _call_in_loop(self, func, *args):
+        """Run func on the simulation thread between ticks and return its result
+
+        Keeps changes made from other threads from racing with a tick.
+        """
+        future = Future()
+        with self._commands_lock:
+            queued = (self.running
+                      and threading.current_thread() is not self._tick_thread)
+            if queued:
+                self._commands.put((future, func, args))
+        if not queued:
+            return func(*args)
+        return future.result()
+
     def tick(self):
         """Single simulation update"""
         self._tick_count += 1
@@ -66,22 +150,35 @@ class SimulationEngine:
         self._update_world()
 
         # Process all creatures
-        creatures_to_remove = []
-        for creature_id, creature in self.creatures.items():
-            self._update_creature(creature)
-
-            # Mark dying creatures for removal
-            if creature.state == CreatureState.DYING:
-                creatures_to_remove.append(creature_id)
+        state_counts = Counter()
+        environment = self._environment_effects()
+        for creature in self.creatures.values():
+            self._update_creature(creature, environment)
+            state_counts[creature.state] += 1
+        self._state_counts = state_counts
+
+        # The FSM lists creatures as they start dying; only creatures that
+        # were already dying before this tick (e.g. loaded that way) need a scan
+        creatures_to_remove = self.behavior_fsm.dying
+        self.behavior_fsm.dying = []
+        if state_counts[CreatureState.DYING] != len(creatures_to_remove):
+            creatures_to_remove = [
+                creature for creature in self.creatures.values()
+                if creature.state == CreatureState.DYING
+            ]
+
+        # Births and deaths go out as one log record per tick, and are only
+        # formatted when INFO is enabled
+        events = [] if self.logger.isEnabledFor(logging.INFO) else None
 
         # Remove dead creatures
-        for creature_id in creatures_to_remove:
-            dead_creature = self.creatures[creature_id]
-            self.logger.info(f"Creature {dead_creature.name} died at age {dead_creature.age} "
-                             f"(cause: {dead_creature.traits.get(
-                                 'death_cause', 'unknown')}) "
-                             f"Final happiness: {dead_creature.happiness}")
-            del self.creatures[creature_id]
+        for dead_creature in creatures_to_remove:
+            if events is not None:
+                events.append(
+                    f"{dead_creature.name} died at age {dead_creature.age} "
+                    f"(cause: {dead_creature.traits.get('death_cause', 'unknown')}, "
+                    f"final happiness: {dead_creature.happiness})")
+            self._unregister_creature(dead_creature)
             self.world_state.population_count -= 1
             self._deaths_this_session += 1
 
@@ -89,20 +186,24 @@ class SimulationEngine:
         new_creatures = process_pending_offspring(
             self.creatures, self.world_state)
         for new_creature in new_creatures:
-            self.creatures[new_creature.id] = new_creature
+            self._register_creature(new_creature)
             self.world_state.population_count += 1
             self._births_this_session += 1
-            self.logger.info(f"New creature born: {new_creature.name} "
-                             f"(parent: {new_creature.traits.get(
-                                 'parent_id', 'unknown')[:8]}) "
-                             f"Starting happiness: {new_creature.happiness}")
+            if events is not None:
+                events.append(
+                    f"{new_creature.name} born "
+                    f"(parent: {new_creature.traits.get('parent_id', 'unknown')[:8]}, "
+                    f"starting happiness: {new_creature.happiness})")
+
+        if events:
+            self.logger.info("Tick %d: %s", self._tick_count, "; ".join(events))
 
         # Periodic logging and saves
         if self._tick_count % 12 == 0:  # Every minute (12 ticks * 5 seconds)
             self._log_population_status()
 
         if self._tick_count % 6 == 0:  # Every 30 seconds
-            self.save_state()
+            self._save_in_background()
 
     def _update_world(self):
         """Update world resources and environment"""
@@ -116,92 +217,117 @@ class SimulationEngine:
         # Random environmental changes occasionally
         if self._tick_count % 60 == 0:  # Every 5 minutes
             # Small temperature fluctuations
-            temp_change = random.randint(-2, 2)
+            temp_change = self.rng.randint(-2, 2)
             self.world_state.temperature = max(
                 10, min(30, self.world_state.temperature + temp_change))
 
             # Occasional food abundance or scarcity
-            if random.random() < 0.1:  # 10% chance
-                if random.random() < 0.5:
+            if self._random() < 0.1:  # 10% chance
+                if self._random() < 0.5:
                     # Food abundance - makes all creatures happier
                     self.world_state.food = min(
                         self.world_state.max_food, self.world_state.food + 20)
                     self.logger.info("Environmental event: Food abundance!")
                     # Boost happiness for all creatures
-                    for creature in self.creatures.values():
-                        creature.happiness = min(
-                            100, creature.happiness + random.randint(5, 10))
+                    self._adjust_all_happiness(5, 10, 1)
                 else:
                     # Food scarcity - makes creatures less happy
                     self.world_state.food = max(0, self.world_state.food - 15)
                     self.logger.info("Environmental event: Food scarcity!")
                     # Reduce happiness for all creatures
-                    for creature in self.creatures.values():
-                        creature.happiness = max(
-                            0, creature.happiness - random.randint(3, 8))
+                    self._adjust_all_happiness(3, 8, -1)
 
         # Update population count
         self.world_state.population_count = len(self.creatures)
+        # The tick's one clock read; behavior timestamps reuse it
         self.world_state.last_update = time.time()
 
-    def _update_creature(self, creature: Creature):
+    def _adjust_all_happiness(self, low: int, high: int, sign: int):
+        """Move every creature's happiness by its own draw from low..high"""
+        roll = self._roll
+        for creature in self.creatures.values():
+            happiness = creature.happiness + sign * roll(low, high)
+            creature.happiness = 0 if happiness < 0 else 100 if happiness > 100 else happiness
+
+    def _environment_effects(self) -> List[tuple]:
+        """Happiness effects shared by every creature this tick
+
+        Returns (low, high, sign) ranges; each creature draws its own amount
+        from each range. Each effect only comes up once every
+        ENVIRONMENT_PERIOD ticks, with its range scaled to match.
+        """
+        effects = []
+        phase = self._tick_count % ENVIRONMENT_PERIOD
+        scale = ENVIRONMENT_PERIOD
+
+        if phase == 0:
+            # Temperature affects happiness
+            temperature = self.world_state.temperature
+            if temperature < 15 or temperature > 25:
+                # Uncomfortable temperature
+                effects.append((0, 2 * scale, -1))
+            elif 18 <= temperature <= 22:
+                # Perfect temperature
+                effects.append((0, 1 * scale, 1))
+
+        elif phase == ENVIRONMENT_PERIOD // 2:
+            # Social happiness - creatures are happier when there are others around
+            population_ratio = len(self.creatures) / \
+                self.world_state.max_population
+            if population_ratio > 0.8:
+                # Overcrowding stress
+                effects.append((1 * scale, 2 * scale, -1))
+            elif 0.3 <= population_ratio <= 0.7:
+                # Good social balance
+                effects.append((0, 1 * scale, 1))
+            elif population_ratio < 0.1:
+                # Loneliness
+                effects.append((0, 1 * scale, -1))
+
+        return effects
+
+    def _roll(self, low: int, high: int) -> int:
+        """Uniform integer in low..high, a single float draw unlike randint"""
+        return low + int(self._random() * (high - low + 1))
+
+    def _update_creature(self, creature: Creature, environment: List[tuple]):
         """Update single creature using FSM"""
         # Age and natural processes
         creature.age += 1
         # Get hungrier over time
         creature.hunger = min(100, creature.hunger + 2)
 
+        # Happiness changes are summed and clamped to 0-100 once at the end
+        delta = 0
+        roll = self._roll
+
         # Environmental happiness effects
-        # Temperature affects happiness
-        if self.world_state.temperature < 15 or self.world_state.temperature > 25:
-            # Uncomfortable temperature
-            creature.happiness = max(
-                0, creature.happiness - random.randint(0, 2))
-        elif 18 <= self.world_state.temperature <= 22:
-            # Perfect temperature
-            creature.happiness = min(
-                100, creature.happiness + random.randint(0, 1))
-
-        # Social happiness - creatures are happier when there are others around
-        population_ratio = len(self.creatures) / \
-            self.world_state.max_population
-        if population_ratio > 0.8:
-            # Overcrowding stress
-            creature.happiness = max(
-                0, creature.happiness - random.randint(1, 2))
-        elif 0.3 <= population_ratio <= 0.7:
-            # Good social balance
-            creature.happiness = min(
-                100, creature.happiness + random.randint(0, 1))
-        elif population_ratio < 0.1:
-            # Loneliness
-            creature.happiness = max(
-                0, creature.happiness - random.randint(0, 1))
+        for low, high, sign in environment:
+            delta += sign * roll(low, high)
 
         # Age-related happiness changes
         age_ratio = creature.age / creature.max_age
         if age_ratio > 0.9:
             # Very old - declining happiness
-            creature.happiness = max(
-                0, creature.happiness - random.randint(1, 3))
+            delta -= roll(1, 3)
         elif age_ratio > 0.8:
             # Old age starting to affect happiness
-            creature.happiness = max(
-                0, creature.happiness - random.randint(0, 2))
+            delta -= roll(0, 2)
         elif 0.2 <= age_ratio <= 0.6:
             # Prime of life - naturally happy
-            creature.happiness = min(
-                100, creature.happiness + random.randint(0, 1))
+            delta += roll(0, 1)
 
         # Energy affects happiness
         if creature.energy < 20:
             # Low energy makes creatures sad
-            creature.happiness = max(
-                0, creature.happiness - random.randint(2, 4))
+            delta -= roll(2, 4)
         elif creature.energy > 80:
             # High energy makes creatures happy
-            creature.happiness = min(
-                100, creature.happiness + random.randint(0, 2))
+            delta += roll(0, 2)
+
+        if delta:
+            happiness = creature.happiness + delta
+            creature.happiness = 0 if happiness < 0 else 100 if happiness > 100 else happiness
 
         # Apply FSM behavior (which will also modify happiness)
         self.behavior_fsm.update_creature(creature, self.world_state)
@@ -226,6 +352,9 @@ class SimulationEngine:
 
     def add_creature(self, name: str = None) -> Creature:
         """Add new creature to simulation"""
+        return self._call_in_loop(self._add_creature, name)
+
+    def _add_creature(self, name: Optional[str]) -> Creature:
         if not self.world_state.can_support_creature():
             raise ValueError("Cannot add creature: Population limit reached")
 
@@ -233,7 +362,7 @@ class SimulationEngine:
             name = f"Thronglet-{len(self.creatures):04d}"
 
         # Random starting happiness (but not too extreme)
-        starting_happiness = random.randint(40, 60)
+        starting_happiness = self.rng.randint(40, 60)
 
         creature = Creature(
             id=str(uuid.uuid4()),
@@ -243,7 +372,7 @@ class SimulationEngine:
             traits={'generation': 0, 'birth_time': time.time()}
         )
 
-        self.creatures[creature.id] = creature
+        self._register_creature(creature)
         self.world_state.population_count += 1
         self.logger.info(f"Creature added: {creature.name} ({creature.id[:8]}) "
                          f"Starting happiness: {creature.happiness}")
@@ -251,18 +380,48 @@ class SimulationEngine:
 
     def remove_creature(self, creature_id: str) -> bool:
         """Remove creature from simulation"""
+        return self._call_in_loop(self._remove_creature, creature_id)
+
+    def _remove_creature(self, creature_id: str) -> bool:
         if creature_id in self.creatures:
             creature = self.creatures[creature_id]
-            del self.creatures[creature_id]
+            self._unregister_creature(creature)
             self.world_state.population_count -= 1
             self.logger.info(f"Creature removed: {creature.name}")
             return True
         return False
 
+    def _register_creature(self, creature: Creature):
+        """Add creature to the id map and the name index"""
+        self.creatures[creature.id] = creature
+        self._by_name.setdefault(creature.name, {})[creature.id] = creature
+        self._state_counts[creature.state] += 1
+
+    def _unregister_creature(self, creature: Creature):
+        """Drop creature from the id map and the name index"""
+        del self.creatures[creature.id]
+        self._state_counts[creature.state] -= 1
+        same_name = self._by_name.get(creature.name)
+        if same_name is not None:
+            same_name.pop(creature.id, None)
+            if not same_name:
+                del self._by_name[creature.name]
+
+    def get_creature_by_name(self, name: str) -> Optional[Creature]:
+        """Look up a creature by name, oldest first when names repeat"""
+        same_name = self._by_name.get(name)
+        if not same_name:
+            return None
+        return next(iter(same_name.values()), None)
+
+    def get_state_counts(self) -> Dict[str, int]:
+        """Count of creatures in each state, without scanning the population"""
+        return {state.value: count
+                for state, count in self._state_counts.items() if count > 0}
+
     def get_machine_id(self) -> str:
         """Get unique machine identifier"""
-        import socket
-        return socket.gethostname()
+        return self._machine_id
 
     def get_simulation_stats(self) -> Dict:
         """Get comprehensive simulation statistics"""
@@ -292,6 +451,12 @@ class SimulationEngine:
         self.creatures = self.repository.load_creatures()
         self.world_state = self.repository.load_world_state()
 
+        self._by_name = {}
+        for creature in self.creatures.values():
+            self._by_name.setdefault(creature.name, {})[creature.id] = creature
+        self._state_counts = Counter(
+            creature.state for creature in self.creatures.values())
+
         # Initialize generation tracking for loaded creatures
         for creature in self.creatures.values():
             if 'generation' not in creature.traits:
@@ -310,8 +475,35 @@ class SimulationEngine:
         except Exception as e:
             self.logger.error(f"Failed to save state: {e}")
 
+    def _save_in_background(self):
+        """Snapshot state now and leave writing it to disk to the save worker"""
+        if self._save_executor is None:
+            self.save_state()
+            return
+        if self._save_future is not None and not self._save_future.done():
+            return  # Previous save still writing, the next period catches up
+
+        try:
+            # Encoding is the snapshot, creatures keep changing after this
+            creatures_data = self.repository.encode_creatures(self.creatures)
+            world_data = self.repository.encode_world_state(self.world_state)
+        except Exception as e:
+            self.logger.error(f"Failed to save state: {e}")
+            return
+        self._save_future = self._save_executor.submit(
+            self._write_saved_state, creatures_data, world_data)
+
+    def _write_saved_state(self, creatures_data: bytes, world_data: bytes):
+        try:
+            self.repository.save_encoded_state(creatures_data, world_data)
+        except Exception as e:
+            self.logger.error(f"Failed to save state: {e}")
+
     def force_reproduction(self, creature_id: str) -> bool:
         """Force a creature to reproduce (for testing)"""
+        return self._call_in_loop(self._force_reproduction, creature_id)
+
+    def _force_reproduction(self, creature_id: str) -> bool:
         if creature_id not in self.creatures:
             return False
 
@@ -320,7 +512,9 @@ class SimulationEngine:
             self.world_state.can_support_creature() and
                 creature.state != CreatureState.DYING):
 
+            self._state_counts[creature.state] -= 1
             creature.state = CreatureState.REPRODUCING
+            self._state_counts[creature.state] += 1
             self.logger.info(f"Forced reproduction for {
                              creature.name} (happiness: {creature.happiness})")
             return True
@@ -328,6 +522,9 @@ class SimulationEngine:
 
     def feed_all_creatures(self):
         """Emergency feeding for all creatures (for testing)"""
+        return self._call_in_loop(self._feed_all_creatures)
+
+    def _feed_all_creatures(self) -> int:
         fed_count = 0
         for creature in self.creatures.values():
             if creature.hunger > 50:
@@ -335,7 +532,7 @@ class SimulationEngine:
                 creature.energy = min(100, creature.energy + 10)
                 # Emergency feeding makes creatures happy
                 creature.happiness = min(
-                    100, creature.happiness + random.randint(5, 15))
+                    100, creature.happiness + self.rng.randint(5, 15))
                 fed_count += 1
 
         self.logger.info(f"Emergency feeding: {
@@ -357,13 +554,17 @@ class SimulationEngine:
 
     def accept_migrated_creature(self, creature_data: Dict[str, Any], source_machine: str) -> bool:
         """Accept a creature migrating from another machine"""
+        return self._call_in_loop(
+            self._accept_migrated_creature, creature_data, source_machine)
+
+    def _accept_migrated_creature(self, creature_data: Dict[str, Any], source_machine: str) -> bool:
         try:
             if not self.world_state.can_support_creature():
                 return False
 
             migrated_creature = Creature.from_migration_data(
                 creature_data, self.get_machine_id())
-            self.creatures[migrated_creature.id] = migrated_creature
+            self._register_creature(migrated_creature)
             self.world_state.population_count += 1
 
             self.logger.info(f"Accepted migrated creature {